@@ -12,15 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import os
 from collections import OrderedDict
-from statistics import mode
 from typing import Dict, Optional
 
 import torch
 
 from nemo.collections.asr.parts.utils.offline_clustering import get_argmin_mat
-from nemo.collections.asr.parts.utils.speaker_utils import convert_rttm_line, prepare_split_data
+from nemo.collections.asr.parts.utils.speaker_utils import (
+    convert_rttm_line,
+    get_majority_mapped_labels,
+    load_pickle_with_buffers,
+    prepare_split_data,
+)
 from nemo.collections.common.parts.preprocessing.collections import DiarizationSpeechLabel
 from nemo.core.classes import Dataset
 from nemo.core.neural_types import AudioSignal, EncodedRepresentation, LengthsType, NeuralType, ProbsType
@@ -234,7 +239,8 @@ class _AudioMSDDTrainDataset(Dataset):
         """
         Assign the generated speaker labels from the base scale (the finest scale) to the longer scales.
         This process is needed to get the cluster labels for each scale. The cluster labels are needed to
-        calculate the cluster-average speaker embedding for each scale.
+        calculate the cluster-average speaker embedding for each scale. Each segment takes the most frequent label
+        of the base-scale segments mapped to it, and ties go to the label that appears first.
 
         Args:
             uniq_id (str):
@@ -255,17 +261,18 @@ class _AudioMSDDTrainDataset(Dataset):
         per_scale_clus_label = []
         self.scale_n = len(self.multiscale_timestamp_dict[uniq_id]['scale_dict'])
         uniq_scale_mapping = get_scale_mapping_list(self.multiscale_timestamp_dict[uniq_id])
+        # Base-scale labels range from -1 (non-target speaker) to the number of target speakers - 1.
+        base_scale_clus_label = base_scale_clus_label.long().cpu().numpy()
         for scale_index in range(self.scale_n):
-            new_clus_label = []
             scale_seq_len = len(self.multiscale_timestamp_dict[uniq_id]["scale_dict"][scale_index]["time_stamps"])
-            for seg_idx in range(scale_seq_len):
-                if seg_idx in uniq_scale_mapping[scale_index]:
-                    seg_clus_label = mode(base_scale_clus_label[uniq_scale_mapping[scale_index] == seg_idx])
-                else:
-                    seg_clus_label = 0 if len(new_clus_label) == 0 else new_clus_label[-1]
-                new_clus_label.append(seg_clus_label)
-            per_scale_clus_label.extend(new_clus_label)
-        per_scale_clus_label = torch.tensor(per_scale_clus_label)
+            # Majority vote of the base-scale labels mapped to each segment in the current scale.
+            new_clus_label = torch.from_numpy(
+                get_majority_mapped_labels(
+                    uniq_scale_mapping[scale_index].long().cpu().numpy(), base_scale_clus_label, scale_seq_len
+                )
+            )
+            per_scale_clus_label.append(new_clus_label)
+        per_scale_clus_label = torch.cat(per_scale_clus_label)
         return per_scale_clus_label, uniq_scale_mapping
 
     def get_diar_target_labels(self, uniq_id, sample, fr_level_target):
@@ -456,6 +463,10 @@ class _AudioMSDDInferDataset(Dataset):
             Use only one scale for clustering instead of using multiple scales of embeddings for clustering.
         pairwise_infer (bool):
             This variable should be True if dataloader is created for an inference task.
+        emb_cache_filepath (str, optional):
+            Path to the clustering output cache file containing `emb_dict`, `emb_seq` and `clus_label_dict`.
+            If provided, these dictionaries are not pickled into dataloader worker processes; each worker
+            loads them from this file on its first `__getitem__` call instead.
     """
 
     @property
@@ -483,6 +494,7 @@ class _AudioMSDDInferDataset(Dataset):
         window_stride: float,
         use_single_scale_clus: bool,
         pairwise_infer: bool,
+        emb_cache_filepath: Optional[str] = None,
     ):
         super().__init__()
         self.collection = DiarizationSpeechLabel(
@@ -503,6 +515,25 @@ class _AudioMSDDInferDataset(Dataset):
         self.max_spks = 2
         self.use_single_scale_clus = use_single_scale_clus
         self.seq_eval_mode = seq_eval_mode
+        self.emb_cache_filepath = emb_cache_filepath
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.emb_cache_filepath is not None:
+            # Send only the cache file path to worker processes instead of the embedding dictionaries.
+            state['emb_dict'], state['emb_seq'], state['clus_label_dict'] = None, None, None
+            collection = copy.copy(self.collection)
+            collection.emb_dict, collection.clus_label_dict = None, None
+            state['collection'] = collection
+        return state
+
+    def _load_emb_cache(self):
+        """
+        Load the embedding dictionaries from `self.emb_cache_filepath` if they were dropped when this dataset was
+        sent to a dataloader worker process.
+        """
+        if self.emb_dict is None:
+            self.emb_dict, self.emb_seq, self.clus_label_dict, _ = load_pickle_with_buffers(self.emb_cache_filepath)
 
     def __len__(self):
         return len(self.collection)
@@ -528,7 +559,7 @@ class _AudioMSDDInferDataset(Dataset):
             raise ValueError(f"RTTM file is not provided for this sample {sample}")
         rttm_lines = open(sample.rttm_file).readlines()
         uniq_id = os.path.splitext(os.path.basename(sample.rttm_file))[0]
-        mapping_dict = self.emb_dict[max(self.emb_dict.keys())][uniq_id]['mapping']
+        mapping_dict = self.emb_dict[max(self.emb_dict.keys())][uniq_id].mapping
         rttm_timestamps = extract_seg_info_from_rttm(uniq_id, rttm_lines, mapping_dict, sample.target_spks)
         fr_level_target = assign_frame_level_spk_vector(
             rttm_timestamps, self.round_digits, self.frame_per_sec, sample.target_spks
@@ -573,13 +604,14 @@ class _AudioMSDDInferDataset(Dataset):
             return seg_target
 
     def __getitem__(self, index):
+        self._load_emb_cache()
         sample = self.collection[index]
         if sample.offset is None:
             sample.offset = 0
 
         uniq_id = os.path.splitext(os.path.basename(sample.audio_file))[0]
         scale_n = len(self.emb_dict.keys())
-        _avg_embs = torch.stack([self.emb_dict[scale_index][uniq_id]['avg_embs'] for scale_index in range(scale_n)])
+        _avg_embs = torch.stack([self.emb_dict[scale_index][uniq_id].avg_embs for scale_index in range(scale_n)])
 
         if self.pairwise_infer:
             avg_embs = _avg_embs[:, :, self.collection[index].target_spks]
@@ -822,6 +854,9 @@ class AudioToSpeechMSDDInferDataset(_AudioMSDDInferDataset):
             If True, this Dataset class operates in inference mode. In inference mode, a set of speakers in the input audio
             is split into multiple pairs of speakers and speaker tuples (e.g. 3 speakers: [(0,1), (1,2), (0,2)]) and then
             fed into the MSDD to merge the individual results.
+        emb_cache_filepath (str, optional):
+            Path to the clustering output cache file. If provided, the embedding dictionaries are loaded from this file
+            in dataloader worker processes instead of being pickled into them.
     """
 
     def __init__(
@@ -836,6 +871,7 @@ class AudioToSpeechMSDDInferDataset(_AudioMSDDInferDataset):
         seq_eval_mode: bool,
         window_stride: float,
         pairwise_infer: bool,
+        emb_cache_filepath: Optional[str] = None,
     ):
         super().__init__(
             manifest_filepath=manifest_filepath,
@@ -847,6 +883,7 @@ class AudioToSpeechMSDDInferDataset(_AudioMSDDInferDataset):
             window_stride=window_stride,
             seq_eval_mode=seq_eval_mode,
             pairwise_infer=pairwise_infer,
+            emb_cache_filepath=emb_cache_filepath,
         )
 
     def msdd_infer_collate_fn(self, batch):
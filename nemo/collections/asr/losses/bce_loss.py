@@ -16,20 +16,28 @@
 import torch
 
 from nemo.core.classes import Loss, Typing, typecheck
-from nemo.core.neural_types import LabelsType, LengthsType, LossType, NeuralType, ProbsType
+from nemo.core.neural_types import LabelsType, LengthsType, LogitsType, LossType, NeuralType, ProbsType
 
 __all__ = ['BCELoss']
 
 
 class BCELoss(Loss, Typing):
     """
-    Computes Binary Cross Entropy (BCE) loss. The BCELoss class expects output from Sigmoid function.
+    Computes Binary Cross Entropy (BCE) loss. The BCELoss class expects output from Sigmoid function, or the logits
+    before the Sigmoid function if `from_logits=True`. In the latter case, the Sigmoid function is fused into the loss,
+    which is numerically more stable.
     """
 
     @property
     def input_types(self):
         """Input types definitions for AnguarLoss.
         """
+        if self.from_logits:
+            return {
+                "logits": NeuralType(('B', 'T', 'C'), LogitsType()),
+                'labels': NeuralType(('B', 'T', 'C'), LabelsType()),
+                "signal_lengths": NeuralType(tuple('B'), LengthsType()),
+            }
         return {
             "probs": NeuralType(('B', 'T', 'C'), ProbsType()),
             'labels': NeuralType(('B', 'T', 'C'), LabelsType()),
@@ -43,20 +51,27 @@ class BCELoss(Loss, Typing):
         """
         return {"loss": NeuralType(elements_type=LossType())}
 
-    def __init__(self, reduction='sum', alpha=1.0, weight=torch.tensor([0.5, 0.5])):
+    def __init__(self, reduction='sum', alpha=1.0, weight=torch.tensor([0.5, 0.5]), from_logits=False):
         super().__init__()
         self.reduction = reduction
         self.loss_weight = weight
-        self.loss_f = torch.nn.BCELoss(weight=self.loss_weight, reduction=self.reduction)
+        self.from_logits = from_logits
+        if self.from_logits:
+            self.loss_f = torch.nn.BCEWithLogitsLoss(weight=self.loss_weight, reduction=self.reduction)
+        else:
+            self.loss_f = torch.nn.BCELoss(weight=self.loss_weight, reduction=self.reduction)
 
     @typecheck()
-    def forward(self, probs, labels, signal_lengths):
+    def forward(self, labels, signal_lengths, probs=None, logits=None):
         """
-        Calculate binary cross entropy loss based on probs, labels and signal_lengths variables.
+        Calculate binary cross entropy loss based on probs (or logits), labels and signal_lengths variables.
 
         Args:
             probs (torch.tensor)
                 Predicted probability value which ranges from 0 to 1. Sigmoid output is expected.
+                Used if `from_logits=False`.
+            logits (torch.tensor)
+                Predicted logits before the Sigmoid function. Used if `from_logits=True`.
             labels (torch.tensor)
                 Groundtruth label for the predicted samples.
             signal_lengths (torch.tensor):
@@ -66,6 +81,7 @@ class BCELoss(Loss, Typing):
             loss (NeuralType)
                 Binary cross entropy loss value.
         """
+        probs = logits if self.from_logits else probs
         probs_list = [probs[k, : signal_lengths[k], :] for k in range(probs.shape[0])]
         targets_list = [labels[k, : signal_lengths[k], :] for k in range(labels.shape[0])]
         probs = torch.cat(probs_list, dim=0)
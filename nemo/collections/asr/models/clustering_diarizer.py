@@ -33,6 +33,7 @@ from nemo.collections.asr.parts.mixins.mixins import DiarizationMixin
 from nemo.collections.asr.parts.utils.speaker_utils import (
     audio_rttm_map,
     get_embs_and_timestamps,
+    get_uniq_id_list_from_manifest,
     get_uniqname_from_filepath,
     parse_scale_configs,
     perform_clustering,
@@ -91,6 +92,7 @@ class ClusteringDiarizer(torch.nn.Module, Model, DiarizationMixin):
 
         # init speaker model
         self.multiscale_embeddings_and_timestamps = {}
+        self.embs_and_timestamps = {}
         self._init_speaker_model(speaker_model)
         self._speaker_params = self._cfg.diarizer.speaker_embeddings.parameters
 
@@ -204,10 +206,7 @@ class ClusteringDiarizer(torch.nn.Module, Model, DiarizationMixin):
         trunc = int(time_unit / 2)
         trunc_l = time_unit - trunc
         all_len = 0
-        data = []
-        for line in open(manifest_file, 'r', encoding='utf-8'):
-            file = json.loads(line)['audio_filepath']
-            data.append(get_uniqname_from_filepath(file))
+        data = get_uniq_id_list_from_manifest(manifest_file)
 
         status = get_vad_stream_status(data)
         for i, test_batch in enumerate(
@@ -357,20 +356,18 @@ class ClusteringDiarizer(torch.nn.Module, Model, DiarizationMixin):
                 all_embs = torch.cat((all_embs, embs.cpu().detach()), dim=0)
             del test_batch
 
+        # Collect the embedding row indices of each session and gather them once instead of concatenating per line.
+        seg_indices = {}
         with open(manifest_file, 'r', encoding='utf-8') as manifest:
-            for i, line in enumerate(manifest.readlines()):
-                line = line.strip()
+            for i, line in enumerate(manifest):
                 dic = json.loads(line)
                 uniq_name = get_uniqname_from_filepath(dic['audio_filepath'])
-                if uniq_name in self.embeddings:
-                    self.embeddings[uniq_name] = torch.cat((self.embeddings[uniq_name], all_embs[i].view(1, -1)))
-                else:
-                    self.embeddings[uniq_name] = all_embs[i].view(1, -1)
-                if uniq_name not in self.time_stamps:
-                    self.time_stamps[uniq_name] = []
+                seg_indices.setdefault(uniq_name, []).append(i)
                 start = dic['offset']
                 end = start + dic['duration']
-                self.time_stamps[uniq_name].append([start, end])
+                self.time_stamps.setdefault(uniq_name, []).append([start, end])
+        for uniq_name, uniq_seg_indices in seg_indices.items():
+            self.embeddings[uniq_name] = all_embs[uniq_seg_indices]
 
         if self._speaker_params.save_embeddings:
             embedding_dir = os.path.join(self._speaker_dir, 'embeddings')
@@ -379,8 +376,9 @@ class ClusteringDiarizer(torch.nn.Module, Model, DiarizationMixin):
 
             prefix = get_uniqname_from_filepath(manifest_file)
             name = os.path.join(embedding_dir, prefix)
-            self._embeddings_file = name + f'_embeddings.pkl'
-            pkl.dump(self.embeddings, open(self._embeddings_file, 'wb'))
+            self._embeddings_file = name + '_embeddings.pkl'
+            with open(self._embeddings_file, 'wb') as f:
+                pkl.dump(self.embeddings, f, protocol=pkl.HIGHEST_PROTOCOL)
             logging.info("Saved embedding files to {}".format(embedding_dir))
 
     def diarize(self, paths2audio_files: List[str] = None, batch_size: int = 0):
@@ -436,13 +434,13 @@ class ClusteringDiarizer(torch.nn.Module, Model, DiarizationMixin):
 
             self.multiscale_embeddings_and_timestamps[scale_idx] = [self.embeddings, self.time_stamps]
 
-        embs_and_timestamps = get_embs_and_timestamps(
+        self.embs_and_timestamps = get_embs_and_timestamps(
             self.multiscale_embeddings_and_timestamps, self.multiscale_args_dict
         )
 
         # Clustering
         all_reference, all_hypothesis = perform_clustering(
-            embs_and_timestamps=embs_and_timestamps,
+            embs_and_timestamps=self.embs_and_timestamps,
             AUDIO_RTTM_MAP=self.AUDIO_RTTM_MAP,
             out_rttm_dir=out_rttm_dir,
             clustering_params=self._cluster_params,
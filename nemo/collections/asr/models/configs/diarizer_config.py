@@ -138,6 +138,8 @@ class ClusteringParams(DiarizerComponentConfig):
     sparse_search_volume: int = 30
     # If True, take a majority vote on multiple p-values to estimate the number of speakers.
     maj_vote_spk_count: bool = False
+    # If True, calculate cosine affinity matrices in FP16 on GPU. Eigen decomposition still runs in FP32.
+    fp16_affinity: bool = False
 
 
 @dataclass
@@ -161,6 +163,10 @@ class MSDDParams(DiarizerComponentConfig):
     diar_window_length: int = 50
     # If the estimated number of speakers are larger than this number, overlap speech is not estimated.
     overlap_infer_spk_limit: int = 5
+    # If True, reuse clustering outputs cached in `out_dir` for the same manifest and parameters.
+    use_cached_clustering_outputs: bool = False
+    # Number of threads for computing per-session cluster-average embeddings and scale mappings.
+    num_session_threads: int = 1
 
 
 @dataclass
@@ -13,19 +13,23 @@
 # limitations under the License.
 
 import copy
+import hashlib
 import json
 import os
 import pickle as pkl
 import tempfile
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from statistics import mode
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 import torch
 from hydra.utils import instantiate
-from omegaconf import DictConfig, open_dict
+from omegaconf import DictConfig, OmegaConf, open_dict
 from pyannote.core import Annotation
 from pyannote.metrics.diarization import DiarizationErrorRate
 from pytorch_lightning import LightningModule, Trainer
@@ -48,14 +52,16 @@ from nemo.collections.asr.models.label_models import EncDecSpeakerLabelModel
 from nemo.collections.asr.parts.preprocessing.features import WaveformFeaturizer
 from nemo.collections.asr.parts.utils.speaker_utils import (
     audio_rttm_map,
-    get_embs_and_timestamps,
     get_id_tup_dict,
+    get_majority_mapped_labels,
     get_scale_mapping_argmat,
     get_uniq_id_list_from_manifest,
     labels_to_pyannote_object,
+    load_pickle_with_buffers,
     make_rttm_with_overlap,
     parse_scale_configs,
     rttm_to_labels,
+    save_pickle_with_buffers,
 )
 from nemo.core.classes import ModelPT
 from nemo.core.classes.common import PretrainedModelInfo, typecheck
@@ -76,6 +82,42 @@ except ImportError:
 __all__ = ['EncDecDiarLabelModel', 'ClusterEmbedding', 'NeuralDiarizer']
 
 
+@dataclass(slots=True)
+class SessionAvg:
+    """
+    Cluster-average speaker embeddings of a session in a single scale.
+
+    Attributes:
+        mapping (dict or None):
+            Mapping from clustering speaker labels to RTTM speaker labels. None if RTTM files are not provided.
+        avg_embs (Tensor):
+            Cluster-average embedding vectors. Shape: (emb_dim, max_num_speakers)
+    """
+
+    mapping: Optional[Dict[str, str]]
+    avg_embs: torch.Tensor
+
+
+@lru_cache(maxsize=2)
+def _load_cached_clustering_outputs(cache_path: str, mtime_ns: int, size: int) -> Tuple[Dict, Dict, Dict, Any]:
+    """
+    Load the clustering output cache file once per process. The modification time and size of the file are part of
+    the key so that a rewritten cache file is loaded again.
+    """
+    return load_pickle_with_buffers(cache_path)
+
+
+def _get_file_identity(filepath: Optional[str]) -> Optional[Union[str, List]]:
+    """
+    Identify an input file for cache keys: local files (e.g., model checkpoints or RTTM files) are identified by
+    their absolute path, size and modification time, anything else (e.g., pretrained model names) by the value itself.
+    """
+    if filepath is not None and os.path.isfile(filepath):
+        file_stat = os.stat(filepath)
+        return [os.path.abspath(filepath), file_stat.st_size, file_stat.st_mtime_ns]
+    return filepath
+
+
 class EncDecDiarLabelModel(ModelPT, ExportableEncDecModel):
     """
     Encoder decoder class for multiscale diarization decoder (MSDD). Model class creates training, validation methods for setting
@@ -133,6 +175,11 @@ class EncDecDiarLabelModel(ModelPT, ExportableEncDecModel):
         self.preprocessor = EncDecSpeakerLabelModel.from_config_dict(self.cfg_msdd_model.preprocessor)
         self.frame_per_sec = int(1 / self.preprocessor._cfg.window_stride)
         self.msdd = EncDecDiarLabelModel.from_config_dict(self.cfg_msdd_model.msdd_module)
+        # The compiled function is not registered as a submodule, so the `state_dict` keys are unchanged.
+        if self.cfg_msdd_model.get('compile_msdd', False):
+            self._compiled_msdd_core = torch.compile(self.msdd.core_model, dynamic=True)
+        else:
+            self._compiled_msdd_core = None
 
         if trainer is not None:
             self._init_speaker_model()
@@ -143,6 +190,10 @@ class EncDecDiarLabelModel(ModelPT, ExportableEncDecModel):
         # Call `self.save_hyperparameters` in modelPT.py again since cfg should contain speaker model's config.
         self.save_hyperparameters("cfg")
 
+        # Optional mixed precision for the MSDD decoder only. The preprocessor and the loss are kept in float32.
+        amp_dtype = self.cfg_msdd_model.get('amp_dtype', None)
+        self.amp_dtype = getattr(torch, amp_dtype) if amp_dtype else None
+
         self.loss = instantiate(self.cfg_msdd_model.loss)
         self._accuracy_test = MultiBinaryAccuracy()
         self._accuracy_train = MultiBinaryAccuracy()
@@ -229,18 +280,28 @@ class EncDecDiarLabelModel(ModelPT, ExportableEncDecModel):
         collate_ds = dataset
         collate_fn = collate_ds.msdd_train_collate_fn
         batch_size = config['batch_size']
+        num_workers = config.get('num_workers', 0)
+        # Keep the worker processes alive between epochs instead of re-creating them (and copying the dataset).
         return torch.utils.data.DataLoader(
             dataset=dataset,
             batch_size=batch_size,
             collate_fn=collate_fn,
             drop_last=config.get('drop_last', False),
             shuffle=False,
-            num_workers=config.get('num_workers', 0),
-            pin_memory=config.get('pin_memory', False),
+            num_workers=num_workers,
+            pin_memory=config.get('pin_memory', True),
+            persistent_workers=config.get('persistent_workers', True) and num_workers > 0,
+            prefetch_factor=config.get('prefetch_factor', 2) if num_workers > 0 else None,
         )
 
     def __setup_dataloader_from_config_infer(
-        self, config: DictConfig, emb_dict: dict, emb_seq: dict, clus_label_dict: dict, pairwise_infer=False
+        self,
+        config: DictConfig,
+        emb_dict: dict,
+        emb_seq: dict,
+        clus_label_dict: dict,
+        pairwise_infer=False,
+        emb_cache_filepath: Optional[str] = None,
     ):
         shuffle = config.get('shuffle', False)
 
@@ -258,6 +319,7 @@ class EncDecDiarLabelModel(ModelPT, ExportableEncDecModel):
             window_stride=self._cfg.preprocessor.window_stride,
             use_single_scale_clus=False,
             pairwise_infer=pairwise_infer,
+            emb_cache_filepath=emb_cache_filepath,
         )
         self.data_collection = dataset.collection
         collate_ds = dataset
@@ -291,6 +353,7 @@ class EncDecDiarLabelModel(ModelPT, ExportableEncDecModel):
                 emb_seq=self.emb_seq_test,
                 clus_label_dict=self.clus_test_label_dict,
                 pairwise_infer=self.pairwise_infer,
+                emb_cache_filepath=getattr(self, 'emb_cache_filepath_test', None),
             )
 
     def setup_multiple_test_data(self, test_data_config):
@@ -305,28 +368,34 @@ class EncDecDiarLabelModel(ModelPT, ExportableEncDecModel):
 
     @property
     def input_types(self) -> Optional[Dict[str, NeuralType]]:
-        if hasattr(self.preprocessor, '_sample_rate'):
-            audio_eltype = AudioSignal(freq=self.preprocessor._sample_rate)
-        else:
-            audio_eltype = AudioSignal()
-        return {
-            "features": NeuralType(('B', 'T'), audio_eltype),
-            "feature_length": NeuralType(('B',), LengthsType()),
-            "ms_seg_timestamps": NeuralType(('B', 'C', 'T', 'D'), LengthsType()),
-            "ms_seg_counts": NeuralType(('B', 'C'), LengthsType()),
-            "clus_label_index": NeuralType(('B', 'T'), LengthsType()),
-            "scale_mapping": NeuralType(('B', 'C', 'T'), LengthsType()),
-            "targets": NeuralType(('B', 'T', 'C'), ProbsType()),
-        }
+        # `typecheck` queries the types on every forward call, so they are built once. The sample rate of the
+        # preprocessor does not change after initialization.
+        if getattr(self, '_input_types', None) is None:
+            if hasattr(self.preprocessor, '_sample_rate'):
+                audio_eltype = AudioSignal(freq=self.preprocessor._sample_rate)
+            else:
+                audio_eltype = AudioSignal()
+            self._input_types = {
+                "features": NeuralType(('B', 'T'), audio_eltype),
+                "feature_length": NeuralType(('B',), LengthsType()),
+                "ms_seg_timestamps": NeuralType(('B', 'C', 'T', 'D'), LengthsType()),
+                "ms_seg_counts": NeuralType(('B', 'C'), LengthsType()),
+                "clus_label_index": NeuralType(('B', 'T'), LengthsType()),
+                "scale_mapping": NeuralType(('B', 'C', 'T'), LengthsType()),
+                "targets": NeuralType(('B', 'T', 'C'), ProbsType()),
+            }
+        return self._input_types
 
     @property
     def output_types(self) -> Dict[str, NeuralType]:
-        return OrderedDict(
-            {
-                "probs": NeuralType(('B', 'T', 'C'), ProbsType()),
-                "scale_weights": NeuralType(('B', 'T', 'C', 'D'), ProbsType()),
-            }
-        )
+        if getattr(self, '_output_types', None) is None:
+            self._output_types = OrderedDict(
+                {
+                    "probs": NeuralType(('B', 'T', 'C'), ProbsType()),
+                    "scale_weights": NeuralType(('B', 'T', 'C', 'D'), ProbsType()),
+                }
+            )
+        return self._output_types
 
     def get_ms_emb_seq(
         self, embs: torch.Tensor, scale_mapping: torch.Tensor, ms_seg_counts: torch.Tensor
@@ -425,29 +494,27 @@ class EncDecDiarLabelModel(ModelPT, ExportableEncDecModel):
                 Shape: (batch_size, scale_n, emb_dim, self.num_spks_per_model)
         """
         scale_n, batch_size = scale_mapping[0].shape[0], scale_mapping.shape[0]
-        split_emb_tup = torch.split(embs, ms_seg_counts.view(-1).tolist(), dim=0)
-        batch_emb_list = [split_emb_tup[i : i + scale_n] for i in range(0, len(split_emb_tup), scale_n)]
-        ms_avg_embs_list = []
-        for batch_idx in range(batch_size):
-            oracle_clus_idx = clus_label_index[batch_idx]
-            max_seq_len = sum(ms_seg_counts[batch_idx])
-            clus_label_index_batch = torch.split(oracle_clus_idx[:max_seq_len], ms_seg_counts[batch_idx].tolist())
-            session_avg_emb_set_list = []
-            for scale_index in range(scale_n):
-                spk_set_list = []
-                for idx in range(self.cfg_msdd_model.max_num_of_spks):
-                    _where = (clus_label_index_batch[scale_index] == idx).clone().detach()
-                    if not torch.any(_where):
-                        avg_emb = torch.zeros(self.msdd._speaker_model._cfg.decoder.emb_sizes).to(embs.device)
-                    else:
-                        avg_emb = torch.mean(batch_emb_list[batch_idx][scale_index][_where], dim=0)
-                    spk_set_list.append(avg_emb)
-                session_avg_emb_set_list.append(torch.stack(spk_set_list))
-            session_avg_emb_set = torch.stack(session_avg_emb_set_list)
-            ms_avg_embs_list.append(session_avg_emb_set)
-
-        ms_avg_embs = torch.stack(ms_avg_embs_list).permute(0, 1, 3, 2)
-        ms_avg_embs = ms_avg_embs.float().detach().to(embs.device)
+        num_spks = self.cfg_msdd_model.max_num_of_spks
+        device = embs.device
+
+        # Gather the labels of all segments in the same (batch, scale, segment) order as the rows of `embs`.
+        total_seg_counts = ms_seg_counts.sum(dim=1)
+        seg_mask = torch.arange(clus_label_index.shape[1], device=device).unsqueeze(0) < total_seg_counts.unsqueeze(1)
+        seg_labels = clus_label_index.to(device)[seg_mask].long()
+        group_index = torch.repeat_interleave(
+            torch.arange(batch_size * scale_n, device=device), ms_seg_counts.reshape(-1).to(device)
+        )
+
+        # Sum the embeddings of each (batch, scale, speaker) group in one scatter-add and divide by the group sizes.
+        # Groups without any segment keep zero vectors. Labels outside [0, num_spks) are ignored.
+        valid = (seg_labels >= 0) & (seg_labels < num_spks)
+        bucket_index = group_index[valid] * num_spks + seg_labels[valid]
+        num_buckets = batch_size * scale_n * num_spks
+        sum_embs = torch.zeros(num_buckets, embs.shape[1], dtype=embs.dtype, device=device)
+        sum_embs.index_add_(0, bucket_index, embs[valid])
+        spk_counts = torch.bincount(bucket_index, minlength=num_buckets).clamp_min_(1).unsqueeze(1)
+        ms_avg_embs = (sum_embs / spk_counts).view(batch_size, scale_n, num_spks, -1).permute(0, 1, 3, 2)
+        ms_avg_embs = ms_avg_embs.float().detach()
         assert (
             not ms_avg_embs.requires_grad
         ), "ms_avg_embs.requires_grad = True. ms_avg_embs should be detached from the torch graph."
@@ -513,14 +580,14 @@ class EncDecDiarLabelModel(ModelPT, ExportableEncDecModel):
                 for k, (stt, end) in enumerate(ms_seg_timestamps[batch_idx][scale_idx][:scale_seg_num]):
                     stt, end = int(stt.detach().item()), int(end.detach().item())
                     end = min(end, stt + max_sample_count)
-                    _features = torch.zeros(feat_dim, max_sample_count).to(torch.float32).to(device)
+                    _features = torch.zeros(feat_dim, max_sample_count, dtype=torch.float32, device=device)
                     _features[:, : (end - stt)] = processed_signal[batch_idx][:, stt:end]
                     ms_mel_feat_list.append(_features)
                     ms_mel_feat_len_list.append(end - stt)
             sequence_lengths_list.append(ms_seg_counts[batch_idx][-1])
-        ms_mel_feat = torch.stack(ms_mel_feat_list).to(device)
-        ms_mel_feat_len = torch.tensor(ms_mel_feat_len_list).to(device)
-        seq_len = torch.tensor(sequence_lengths_list).to(device)
+        ms_mel_feat = torch.stack(ms_mel_feat_list)
+        ms_mel_feat_len = torch.tensor(ms_mel_feat_len_list, device=device)
+        seq_len = torch.tensor(sequence_lengths_list, device=device)
 
         if _emb_batch_size == 0:
             attached, _emb_batch_size = torch.tensor([]), 0
@@ -545,6 +612,18 @@ class EncDecDiarLabelModel(ModelPT, ExportableEncDecModel):
     def forward(
         self, features, feature_length, ms_seg_timestamps, ms_seg_counts, clus_label_index, scale_mapping, targets
     ):
+        logits, scale_weights = self._forward_logits(
+            features, feature_length, ms_seg_timestamps, ms_seg_counts, clus_label_index, scale_mapping, targets
+        )
+        return torch.sigmoid(logits), scale_weights
+
+    def _forward_logits(
+        self, features, feature_length, ms_seg_timestamps, ms_seg_counts, clus_label_index, scale_mapping, targets
+    ):
+        """
+        Same as `forward`, but returns the speaker logits before the sigmoid so that the training and validation
+        losses can fuse the sigmoid when `loss.from_logits` is True.
+        """
         processed_signal, processed_signal_len = self.msdd._speaker_model.preprocessor(
             input_signal=features, length=feature_length
         )
@@ -571,57 +650,65 @@ class EncDecDiarLabelModel(ModelPT, ExportableEncDecModel):
 
         ms_emb_seq = self.get_ms_emb_seq(embs, scale_mapping, ms_seg_counts)
         ms_avg_embs = self.get_cluster_avg_embs_model(embs, clus_label_index, ms_seg_counts, scale_mapping)
-        preds, scale_weights = self.msdd(
-            ms_emb_seq=ms_emb_seq, length=sequence_lengths, ms_avg_embs=ms_avg_embs, targets=targets
-        )
-        return preds, scale_weights
+        if self.amp_dtype is not None:
+            msdd_autocast = torch.autocast(device_type=ms_emb_seq.device.type, dtype=self.amp_dtype)
+        else:
+            msdd_autocast = nullcontext()
+        msdd_core = self._compiled_msdd_core if self._compiled_msdd_core is not None else self.msdd.core_model
+        with msdd_autocast:
+            spk_logits, scale_weights = msdd_core(
+                ms_emb_seq, sequence_lengths, ms_avg_embs, targets, return_logits=True
+            )
+        return spk_logits.float(), scale_weights.float()
+
+    def _compute_loss(self, logits, targets, sequence_lengths):
+        if getattr(self.loss, 'from_logits', False):
+            return self.loss(logits=logits, labels=targets, signal_lengths=sequence_lengths)
+        return self.loss(probs=torch.sigmoid(logits), labels=targets, signal_lengths=sequence_lengths)
 
     def training_step(self, batch: list, batch_idx: int):
         features, feature_length, ms_seg_timestamps, ms_seg_counts, clus_label_index, scale_mapping, targets = batch
         sequence_lengths = torch.tensor([x[-1] for x in ms_seg_counts.detach()])
-        preds, _ = self.forward(
-            features=features,
-            feature_length=feature_length,
-            ms_seg_timestamps=ms_seg_timestamps,
-            ms_seg_counts=ms_seg_counts,
-            clus_label_index=clus_label_index,
-            scale_mapping=scale_mapping,
-            targets=targets,
+        logits, _ = self._forward_logits(
+            features, feature_length, ms_seg_timestamps, ms_seg_counts, clus_label_index, scale_mapping, targets
         )
-        loss = self.loss(probs=preds, labels=targets, signal_lengths=sequence_lengths)
-        self._accuracy_train(preds, targets, sequence_lengths)
+        loss = self._compute_loss(logits, targets, sequence_lengths)
+        self._accuracy_train.update(torch.sigmoid(logits.detach()), targets, sequence_lengths)
         torch.cuda.empty_cache()
-        f1_acc = self._accuracy_train.compute()
         self.log('loss', loss, sync_dist=True)
         self.log('learning_rate', self._optimizer.param_groups[0]['lr'], sync_dist=True)
+        return {'loss': loss}
+
+    def on_train_epoch_end(self):
+        # F1 score is accumulated over the epoch to avoid a metric reduction and a device sync in every step.
+        f1_acc = self._accuracy_train.compute()
         self.log('train_f1_acc', f1_acc, sync_dist=True)
         self._accuracy_train.reset()
-        return {'loss': loss}
 
     def validation_step(self, batch: list, batch_idx: int, dataloader_idx: int = 0):
         features, feature_length, ms_seg_timestamps, ms_seg_counts, clus_label_index, scale_mapping, targets = batch
         sequence_lengths = torch.tensor([x[-1] for x in ms_seg_counts])
-        preds, _ = self.forward(
-            features=features,
-            feature_length=feature_length,
-            ms_seg_timestamps=ms_seg_timestamps,
-            ms_seg_counts=ms_seg_counts,
-            clus_label_index=clus_label_index,
-            scale_mapping=scale_mapping,
-            targets=targets,
+        logits, _ = self._forward_logits(
+            features, feature_length, ms_seg_timestamps, ms_seg_counts, clus_label_index, scale_mapping, targets
         )
-        loss = self.loss(probs=preds, labels=targets, signal_lengths=sequence_lengths)
-        self._accuracy_valid(preds, targets, sequence_lengths)
-        f1_acc = self._accuracy_valid.compute()
-        self.log('val_loss', loss, sync_dist=True)
-        self.log('val_f1_acc', f1_acc, sync_dist=True)
-        return {
-            'val_loss': loss,
-            'val_f1_acc': f1_acc,
-        }
-
-    def multi_validation_epoch_end(self, outputs: list, dataloader_idx: int = 0):
-        val_loss_mean = torch.stack([x['val_loss'] for x in outputs]).mean()
+        loss = self._compute_loss(logits, targets, sequence_lengths)
+        self._accuracy_valid.update(torch.sigmoid(logits), targets, sequence_lengths)
+        self._val_loss_sum += loss.detach()
+        self._val_batch_count += 1
+        # `val_loss` is logged once per epoch from the running sum in `multi_validation_epoch_end`.
+        return {'val_loss': loss.detach()}
+
+    def on_validation_epoch_start(self):
+        # Running sum of the validation losses, so that the per-batch losses do not need to be stacked at epoch end.
+        self._val_loss_sum = torch.zeros((), device=self.device)
+        self._val_batch_count = 0
+
+    def on_validation_epoch_end(self) -> Optional[Dict[str, torch.Tensor]]:
+        # The epoch metrics are aggregated while the validation steps run, so no step outputs are kept around.
+        return self.multi_validation_epoch_end(outputs=None)
+
+    def multi_validation_epoch_end(self, outputs: Optional[list] = None, dataloader_idx: int = 0):
+        val_loss_mean = self._val_loss_sum / max(self._val_batch_count, 1)
         f1_acc = self._accuracy_valid.compute()
         self._accuracy_valid.reset()
 
@@ -696,6 +783,7 @@ class ClusterEmbedding(torch.nn.Module):
         self.scale_n = len(self.scale_window_length_list)
         self.base_scale_index = len(self.scale_window_length_list) - 1
         self.clus_diar_model = ClusteringDiarizer(cfg=self.cfg_diar_infer, speaker_model=self._speaker_model)
+        self.clustering_cache_filepath = None
 
     def prepare_cluster_embs_infer(self):
         """
@@ -718,6 +806,7 @@ class ClusterEmbedding(torch.nn.Module):
                 Dictionary containing clustering results for base-scale segments. Indexed by `uniq_id` string.
             session_scale_mapping_dict (dict):
                 Dictionary containing multiscale mapping information for each session. Indexed by `uniq_id` string.
+                Each value is a (scale_n, num_base_segs) integer matrix.
 
         Returns:
             all_scale_clus_label_dict (dict):
@@ -725,21 +814,20 @@ class ClusterEmbedding(torch.nn.Module):
 
         """
         all_scale_clus_label_dict = {scale_index: {} for scale_index in range(self.scale_n)}
-        for uniq_id, uniq_scale_mapping_dict in session_scale_mapping_dict.items():
-            base_scale_clus_label = np.array([x[-1] for x in base_clus_label_dict[uniq_id]])
+        for uniq_id, uniq_scale_mapping_mat in session_scale_mapping_dict.items():
+            base_clus_labels = base_clus_label_dict[uniq_id]
+            base_scale_clus_label = np.fromiter((x[-1] for x in base_clus_labels), np.int64, len(base_clus_labels))
             all_scale_clus_label_dict[self.base_scale_index][uniq_id] = base_scale_clus_label
+            # Contiguous (scale_n, num_base_segs) matrix so that each scale is a plain row slice
+            uniq_scale_mapping_mat = np.ascontiguousarray(uniq_scale_mapping_mat, dtype=np.int64)
+            assert (
+                uniq_scale_mapping_mat.shape[1] == base_scale_clus_label.shape[0]
+            ), "The number of base scale labels does not match the segment numbers in uniq_scale_mapping_mat"
             for scale_index in range(self.scale_n - 1):
-                new_clus_label = []
-                assert (
-                    uniq_scale_mapping_dict[scale_index].shape[0] == base_scale_clus_label.shape[0]
-                ), "The number of base scale labels does not match the segment numbers in uniq_scale_mapping_dict"
-                max_index = max(uniq_scale_mapping_dict[scale_index])
-                for seg_idx in range(max_index + 1):
-                    if seg_idx in uniq_scale_mapping_dict[scale_index]:
-                        seg_clus_label = mode(base_scale_clus_label[uniq_scale_mapping_dict[scale_index] == seg_idx])
-                    else:
-                        seg_clus_label = 0 if len(new_clus_label) == 0 else new_clus_label[-1]
-                    new_clus_label.append(seg_clus_label)
+                scale_mapping = uniq_scale_mapping_mat[scale_index]
+                num_segs = int(scale_mapping.max()) + 1 if scale_mapping.size > 0 else 0
+                # Majority vote of the base-scale labels mapped to each longer-scale segment.
+                new_clus_label = get_majority_mapped_labels(scale_mapping, base_scale_clus_label, num_segs)
                 all_scale_clus_label_dict[scale_index][uniq_id] = new_clus_label
         return all_scale_clus_label_dict
 
@@ -760,11 +848,13 @@ class ClusterEmbedding(torch.nn.Module):
         """
         base_clus_label_dict = {key: [] for key in emb_scale_seq_dict[self.base_scale_index].keys()}
         for line in clus_labels:
-            uniq_id = line.split()[0]
-            label = int(line.split()[-1].split('_')[-1])
-            stt, end = [round(float(x), 2) for x in line.split()[1:3]]
+            line_split = line.split()
+            uniq_id = line_split[0]
+            label = int(line_split[-1].split('_')[-1])
+            stt, end = [round(float(x), 2) for x in line_split[1:3]]
             base_clus_label_dict[uniq_id].append([stt, end, label])
-        emb_dim = emb_scale_seq_dict[0][uniq_id][0].shape[0]
+        # Infer the embedding dimension from any session instead of relying on `uniq_id` leaked from the loop above.
+        emb_dim = next(iter(emb_scale_seq_dict[0].values())).shape[-1]
         return base_clus_label_dict, emb_dim
 
     def get_cluster_avg_embs(
@@ -800,34 +890,66 @@ class ClusterEmbedding(torch.nn.Module):
             scale_index: {key: [] for key in emb_scale_seq_dict[self.scale_n - 1].keys()}
             for scale_index in emb_scale_seq_dict.keys()
         }
-        output_clus_label_dict, emb_dim = self.get_base_clus_label_dict(clus_labels, emb_scale_seq_dict)
+        output_clus_label_dict, _ = self.get_base_clus_label_dict(clus_labels, emb_scale_seq_dict)
         all_scale_clus_label_dict = self.assign_labels_to_longer_segs(
             output_clus_label_dict, session_scale_mapping_dict
         )
+        # The speaker mapping of each session does not depend on the scale, so invert it only once per session.
+        if speaker_mapping_dict is not None:
+            inv_map_dict = {
+                uniq_id: {clus_key: rttm_key for rttm_key, clus_key in spk_mapping.items()}
+                for uniq_id, spk_mapping in speaker_mapping_dict.items()
+            }
+        else:
+            inv_map_dict = {}
+
         for scale_index in emb_scale_seq_dict.keys():
-            for uniq_id, _emb_tensor in emb_scale_seq_dict[scale_index].items():
-                if type(_emb_tensor) == list:
-                    emb_tensor = torch.tensor(np.array(_emb_tensor))
-                else:
-                    emb_tensor = _emb_tensor
-                clus_label_list = all_scale_clus_label_dict[scale_index][uniq_id]
-                spk_set = set(clus_label_list)
-
-                # Create a label array which identifies clustering result for each segment.
-                label_array = torch.Tensor(clus_label_list)
-                avg_embs = torch.zeros(emb_dim, self.max_num_speakers)
-                for spk_idx in spk_set:
-                    selected_embs = emb_tensor[label_array == spk_idx]
-                    avg_embs[:, spk_idx] = torch.mean(selected_embs, dim=0)
-
-                if speaker_mapping_dict is not None:
-                    inv_map = {clus_key: rttm_key for rttm_key, clus_key in speaker_mapping_dict[uniq_id].items()}
-                else:
-                    inv_map = None
-
-                emb_sess_avg_dict[scale_index][uniq_id] = {'mapping': inv_map, 'avg_embs': avg_embs}
+            uniq_id_list = list(emb_scale_seq_dict[scale_index].keys())
+            avg_embs_list = self._map_sessions(
+                self.get_session_cluster_avg_embs,
+                [emb_scale_seq_dict[scale_index][uniq_id] for uniq_id in uniq_id_list],
+                [all_scale_clus_label_dict[scale_index][uniq_id] for uniq_id in uniq_id_list],
+            )
+            for uniq_id, avg_embs in zip(uniq_id_list, avg_embs_list):
+                emb_sess_avg_dict[scale_index][uniq_id] = SessionAvg(
+                    mapping=inv_map_dict.get(uniq_id), avg_embs=avg_embs
+                )
         return emb_sess_avg_dict, output_clus_label_dict
 
+    def get_session_cluster_avg_embs(self, emb_tensor: torch.Tensor, clus_label_list: List[int]) -> torch.Tensor:
+        """
+        Calculate the cluster-average embedding vectors of a single session and scale.
+
+        Args:
+            emb_tensor (Tensor):
+                Embedding sequence of the session in the given scale.
+                Shape: (Number of segments, emb_dim)
+            clus_label_list (list):
+                Cluster label of each segment.
+
+        Returns:
+            avg_embs (Tensor):
+                Cluster-average embedding vectors. Columns of speakers without any segment are filled with zeros.
+                Shape: (emb_dim, self.max_num_speakers)
+        """
+        # Accumulate the embeddings of each cluster in a single scatter-add pass and divide by cluster sizes.
+        label_index = torch.as_tensor(clus_label_list, dtype=torch.long)
+        sum_embs = torch.zeros(self.max_num_speakers, emb_tensor.shape[1]).index_add_(0, label_index, emb_tensor)
+        spk_counts = torch.bincount(label_index, minlength=self.max_num_speakers).clamp_min_(1).unsqueeze(1)
+        return (sum_embs / spk_counts).t().contiguous()
+
+    def _map_sessions(self, func: Callable, *iterables: Iterable) -> List[Any]:
+        """
+        Apply `func` to the per-session arguments in `iterables`. Sessions are processed by a thread pool when
+        `num_session_threads` in the MSDD parameters is larger than 1, since the work is dominated by torch/NumPy
+        operations that release the GIL.
+        """
+        num_threads = self.cfg_diar_infer.diarizer.msdd_model.parameters.get('num_session_threads', 1) or 1
+        if num_threads <= 1:
+            return list(map(func, *iterables))
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            return list(executor.map(func, *iterables))
+
     def run_clustering_diarizer(self, manifest_filepath: str, emb_dir: str):
         """
         If no pre-existing data is provided, run clustering diarizer from scratch. This will create scale-wise speaker embedding
@@ -869,6 +991,19 @@ class ClusterEmbedding(torch.nn.Module):
 
         logging.info(f"Multiscale Weights: {self.clus_diar_model.multiscale_args_dict['multiscale_weights']}")
         logging.info(f"Clustering Parameters: {clustering_params_str}")
+
+        use_cache = self.cfg_diar_infer.diarizer.msdd_model.parameters.get('use_cached_clustering_outputs', False)
+        self.clustering_cache_filepath = None
+        if use_cache:
+            cache_dir = os.path.join(
+                emb_dir, 'speaker_outputs', '.cache', self.get_clustering_cache_key(manifest_filepath)
+            )
+            uniq_id_list = get_uniq_id_list_from_manifest(manifest_filepath)
+            cached_outputs = self.load_cached_clustering_outputs(cache_dir, uniq_id_list)
+            if cached_outputs is not None:
+                self.clustering_cache_filepath = os.path.join(cache_dir, 'clustering_outputs.pkl')
+                return cached_outputs
+
         scores = self.clus_diar_model.diarize(batch_size=self.cfg_diar_infer.batch_size)
 
         # If RTTM (ground-truth diarization annotation) files do not exist, scores is None.
@@ -877,19 +1012,143 @@ class ClusterEmbedding(torch.nn.Module):
         else:
             metric, speaker_mapping_dict = None, None
 
-        # Get the mapping between segments in different scales.
-        self._embs_and_timestamps = get_embs_and_timestamps(
-            self.clus_diar_model.multiscale_embeddings_and_timestamps, self.clus_diar_model.multiscale_args_dict
-        )
+        # Get the mapping between segments in different scales. The embeddings and timestamps are reused from
+        # the clustering diarizer instead of being regrouped or reloaded from the saved embedding pickles.
+        self._embs_and_timestamps = self.clus_diar_model.embs_and_timestamps
         session_scale_mapping_dict = self.get_scale_map(self._embs_and_timestamps)
-        emb_scale_seq_dict = self.load_emb_scale_seq_dict(emb_dir)
+        emb_scale_seq_dict = {
+            scale_index: {uniq_id: emb.float() for uniq_id, emb in embeddings.items()}
+            for scale_index, (embeddings, _) in self.clus_diar_model.multiscale_embeddings_and_timestamps.items()
+        }
         clus_labels = self.load_clustering_labels(emb_dir)
         emb_sess_avg_dict, base_clus_label_dict = self.get_cluster_avg_embs(
             emb_scale_seq_dict, clus_labels, speaker_mapping_dict, session_scale_mapping_dict
         )
         emb_scale_seq_dict['session_scale_mapping'] = session_scale_mapping_dict
+        if use_cache:
+            self.save_cached_clustering_outputs(
+                cache_dir, (emb_sess_avg_dict, emb_scale_seq_dict, base_clus_label_dict, metric), uniq_id_list
+            )
+            self.clustering_cache_filepath = os.path.join(cache_dir, 'clustering_outputs.pkl')
         return emb_sess_avg_dict, emb_scale_seq_dict, base_clus_label_dict, metric
 
+    def get_clustering_cache_key(self, manifest_filepath: str) -> str:
+        """
+        Calculate the key of the clustering output cache from the content of the input manifest file, the identity
+        of the reference RTTM files in the manifest, the VAD, speaker embedding and clustering configurations and
+        the identity of the VAD, speaker and MSDD model checkpoints.
+
+        Args:
+            manifest_filepath (str):
+                Input manifest file for creating audio-to-RTTM mapping.
+
+        Returns:
+            (str): Hexadecimal SHA-1 digest identifying the clustering outputs.
+        """
+        hasher = hashlib.sha1()
+        with open(manifest_filepath, 'rb') as f:
+            manifest_bytes = f.read()
+        hasher.update(manifest_bytes)
+        # The cached speaker mappings and metric are computed from the reference RTTM files
+        rttm_identities = []
+        for line in manifest_bytes.decode('utf-8').splitlines():
+            if line.strip():
+                rttm_identities.append(_get_file_identity(json.loads(line).get('rttm_filepath')))
+        hasher.update(json.dumps(rttm_identities, default=str).encode())
+        diarizer_cfg = self.cfg_diar_infer.diarizer
+        for params in (
+            diarizer_cfg.vad,
+            diarizer_cfg.speaker_embeddings.parameters,
+            diarizer_cfg.clustering.parameters,
+        ):
+            params = OmegaConf.to_container(params, resolve=True) if isinstance(params, DictConfig) else params.dict()
+            hasher.update(json.dumps(params, sort_keys=True, default=str).encode())
+        model_identities = {
+            'oracle_vad': diarizer_cfg.oracle_vad,
+            'vad': _get_file_identity(diarizer_cfg.vad.model_path),
+            'speaker_embeddings': _get_file_identity(diarizer_cfg.speaker_embeddings.model_path),
+            'msdd_model': _get_file_identity(diarizer_cfg.msdd_model.model_path),
+        }
+        hasher.update(json.dumps(model_identities, sort_keys=True, default=str).encode())
+        return hasher.hexdigest()
+
+    def load_cached_clustering_outputs(
+        self, cache_dir: str, uniq_id_list: List[str]
+    ) -> Optional[Tuple[Dict, Dict, Dict, Any]]:
+        """
+        Load the outputs of `run_clustering_diarizer` from the cache directory if the cache is complete.
+        The `READY` sentinel file is checked first, so that incomplete or mismatching caches are skipped
+        without reading the cached outputs. The loaded outputs are memoized per process, keyed by the
+        path, modification time and size of the cache file.
+
+        Args:
+            cache_dir (str):
+                Path to the cache directory of the given manifest file and parameters.
+            uniq_id_list (list):
+                List of `uniq_id` values of the sessions in the input manifest file.
+
+        Returns:
+            cached_outputs (tuple or None):
+                Tuple of `emb_sess_avg_dict`, `emb_scale_seq_dict`, `base_clus_label_dict` and `metric`.
+                None if the cache does not exist, does not cover all sessions or cannot be read.
+        """
+        sentinel_path = os.path.join(cache_dir, 'READY')
+        if not os.path.exists(sentinel_path):
+            return None
+        try:
+            with open(sentinel_path, 'r') as f:
+                cached_uniq_ids = set(json.load(f)['uniq_ids'])
+        except (ValueError, KeyError, TypeError) as e:
+            logging.warning(f"Failed to read cache sentinel {sentinel_path}: {e}")
+            return None
+        if not all(u in cached_uniq_ids for u in uniq_id_list):
+            logging.info(f"Cached clustering outputs in {cache_dir} do not match the input manifest.")
+            return None
+        cache_path = os.path.join(cache_dir, 'clustering_outputs.pkl')
+        try:
+            cache_stat = os.stat(cache_path)
+            cached_outputs = _load_cached_clustering_outputs(cache_path, cache_stat.st_mtime_ns, cache_stat.st_size)
+        except (FileNotFoundError, EOFError, KeyError, TypeError, pkl.UnpicklingError) as e:
+            logging.warning(f"Failed to load cached clustering outputs from {cache_path}: {e}")
+            return None
+        logging.info(f"Loaded cached clustering outputs from {cache_path}")
+        emb_sess_avg_dict, emb_scale_seq_dict, base_clus_label_dict, metric = cached_outputs
+        # Return new dict shells around the shared tensors so that callers cannot modify the memoized outputs.
+        return (
+            {key: dict(value) for key, value in emb_sess_avg_dict.items()},
+            {key: dict(value) for key, value in emb_scale_seq_dict.items()},
+            {uniq_id: [list(label) for label in labels] for uniq_id, labels in base_clus_label_dict.items()},
+            metric,
+        )
+
+    def save_cached_clustering_outputs(
+        self, cache_dir: str, outputs: Tuple[Dict, Dict, Dict, Any], uniq_id_list: List[str]
+    ):
+        """
+        Save the outputs of `run_clustering_diarizer` to the cache directory and mark the cache as ready with a
+        `READY` sentinel file containing the cached session IDs. Both files are written to temporary files and
+        moved into place atomically. Tensors are saved as out-of-band pickle buffers (see `save_pickle_with_buffers`).
+
+        Args:
+            cache_dir (str):
+                Path to the cache directory of the given manifest file and parameters.
+            outputs (tuple):
+                Tuple of `emb_sess_avg_dict`, `emb_scale_seq_dict`, `base_clus_label_dict` and `metric`.
+            uniq_id_list (list):
+                List of `uniq_id` values of the sessions in the input manifest file.
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        cache_path = os.path.join(cache_dir, 'clustering_outputs.pkl')
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        os.close(fd)
+        save_pickle_with_buffers(outputs, tmp_path)
+        os.replace(tmp_path, cache_path)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'uniq_ids': sorted(uniq_id_list)}, f)
+        os.replace(tmp_path, os.path.join(cache_dir, 'READY'))
+        logging.info(f"Saved clustering outputs to cache {cache_path}")
+
     def get_scale_map(self, embs_and_timestamps):
         """
         Save multiscale mapping data into dictionary format.
@@ -900,11 +1159,14 @@ class ClusterEmbedding(torch.nn.Module):
         Returns:
             session_scale_mapping_dict (dict):
                 Dictionary containing multiscale mapping information for each session. Indexed by `uniq_id` string.
+                Each value is an integer tensor of shape (scale_n, num_base_segs) where row `scale_index` maps
+                base-scale segments to the segments of that scale.
         """
-        session_scale_mapping_dict = {}
-        for uniq_id, uniq_embs_and_timestamps in embs_and_timestamps.items():
-            scale_mapping_dict = get_scale_mapping_argmat(uniq_embs_and_timestamps)
-            session_scale_mapping_dict[uniq_id] = scale_mapping_dict
+        scale_mapping_list = self._map_sessions(get_scale_mapping_argmat, embs_and_timestamps.values())
+        session_scale_mapping_dict = {
+            uniq_id: torch.stack([scale_mapping[scale_index] for scale_index in range(len(scale_mapping))])
+            for uniq_id, scale_mapping in zip(embs_and_timestamps.keys(), scale_mapping_list)
+        }
         return session_scale_mapping_dict
 
     def check_clustering_labels(self, out_dir):
@@ -946,31 +1208,6 @@ class ClusterEmbedding(torch.nn.Module):
             clus_labels = f.readlines()
         return clus_labels
 
-    def load_emb_scale_seq_dict(self, out_dir):
-        """
-        Load saved embeddings generated by clustering diarizer. This function is used for inference mode of MSDD.
-
-        Args:
-            out_dir (str):
-                Path to the directory where embedding pickle files are saved.
-        Returns:
-            emb_scale_seq_dict (dict):
-                Dictionary containing embedding tensors which are indexed by scale numbers.
-        """
-        window_len_list = list(self.cfg_diar_infer.diarizer.speaker_embeddings.parameters.window_length_in_sec)
-        emb_scale_seq_dict = {scale_index: None for scale_index in range(len(window_len_list))}
-        for scale_index in range(len(window_len_list)):
-            pickle_path = os.path.join(
-                out_dir, 'speaker_outputs', 'embeddings', f'subsegments_scale{scale_index}_embeddings.pkl'
-            )
-            logging.info(f"Loading embedding pickle file of scale:{scale_index} at {pickle_path}")
-            with open(pickle_path, "rb") as input_file:
-                emb_dict = pkl.load(input_file)
-            for key, val in emb_dict.items():
-                emb_dict[key] = val
-            emb_scale_seq_dict[scale_index] = emb_dict
-        return emb_scale_seq_dict
-
 
 class NeuralDiarizer(LightningModule):
     """
@@ -1173,6 +1410,7 @@ class NeuralDiarizer(LightningModule):
         self.msdd_model.emb_sess_test_dict = cluster_embeddings.emb_sess_test_dict
         self.msdd_model.clus_test_label_dict = cluster_embeddings.clus_test_label_dict
         self.msdd_model.emb_seq_test = cluster_embeddings.emb_seq_test
+        self.msdd_model.emb_cache_filepath_test = cluster_embeddings.clustering_cache_filepath
 
     @torch.no_grad()
     def diarize(self) -> Optional[List[Optional[List[Tuple[DiarizationErrorRate, Dict]]]]]:
@@ -195,7 +195,7 @@ class MSDD_module(NeuralModule, Exportable):
         self.lstm.apply(self.init_weights)
         self.clamp_max = clamp_max
 
-    def core_model(self, ms_emb_seq, length, ms_avg_embs, targets):
+    def core_model(self, ms_emb_seq, length, ms_avg_embs, targets, return_logits: bool = False):
         """
         Core model that accepts multi-scale cosine similarity values and estimates per-speaker binary label.
 
@@ -212,10 +212,12 @@ class MSDD_module(NeuralModule, Exportable):
             targets (Tensor):
                 Ground-truth labels for the finest segment.
                 Shape: (batch_size, feats_len, max_spks)
+            return_logits (bool):
+                If True, return the speaker logits before the sigmoid so that the loss can fuse the sigmoid.
 
         Returns:
             preds (Tensor):
-                Predicted binary speaker label for each speaker.
+                Predicted binary speaker label for each speaker, or the logits of them if `return_logits` is True.
                 Shape: (batch_size, feats_len, max_spks)
             scale_weights (Tensor):
                 Multiscale weights per each base-scale segment.
@@ -251,6 +253,8 @@ class MSDD_module(NeuralModule, Exportable):
         lstm_output = self.lstm(context_emb)
         lstm_hidden_out = self.dropout(F.relu(lstm_output[0]))
         spk_preds = self.hidden_to_spks(lstm_hidden_out)
+        if return_logits:
+            return spk_preds, scale_weights
         preds = nn.Sigmoid()(spk_preds)
         return preds, scale_weights
 
@@ -569,15 +569,16 @@ class BeamRNNTInfer(Typing):
         blank_tensor = torch.tensor([self.blank], device=h.device, dtype=torch.long)
 
         # Precompute some constants for blank position
-        ids = list(range(self.vocab_size + 1))
-        ids.remove(self.blank)
-
         # Used when blank token is first vs last token
         if self.blank == 0:
             index_incr = 1
         else:
             index_incr = 0
 
+        # Non-blank tokens are contiguous: select them with a slice (view)
+        # instead of an index list, which is copied to the device on every step
+        ids = slice(index_incr, index_incr + self.vocab_size)
+
         # Initialize zero vector states
         dec_state = self.decoder.initialize_state(h)
 
@@ -607,27 +608,31 @@ class BeamRNNTInfer(Typing):
                 y, state, lm_tokens = self.decoder.score_hypothesis(max_hyp, cache)  # [1, 1, D]
 
                 # get next token
-                ytu = torch.log_softmax(self.joint.joint(hi, y) / self.softmax_temperature, dim=-1)  # [1, 1, 1, V + 1]
+                ytu = self.joint.joint(hi, y) / self.softmax_temperature  # [1, 1, 1, V + 1]
                 ytu = ytu[0, 0, 0, :]  # [V + 1]
+                # log-probabilities differ from the logits only by the log-normalizer,
+                # so top k is selected on the logits and only the selected candidates are normalized
+                log_normalizer = torch.logsumexp(ytu, dim=-1)
 
                 # preserve alignments
                 if self.preserve_alignments:
-                    logprobs = ytu.cpu().clone()
+                    logprobs = (ytu - log_normalizer).cpu().clone()
 
                 # remove blank token before top k
                 top_k = ytu[ids].topk(beam_k, dim=-1)
 
                 # Two possible steps - blank token or non-blank token predicted
+                # (read to host once, instead of synchronizing for each step)
                 ytu = (
-                    torch.cat((top_k[0], ytu[self.blank].unsqueeze(0))),
-                    torch.cat((top_k[1] + index_incr, blank_tensor)),
+                    (torch.cat((top_k[0], ytu[self.blank].unsqueeze(0))) - log_normalizer).tolist(),
+                    torch.cat((top_k[1] + index_incr, blank_tensor)).tolist(),
                 )
 
                 # for each possible step
                 for logp, k in zip(*ytu):
                     # construct hypothesis for step
                     new_hyp = Hypothesis(
-                        score=(max_hyp.score + float(logp)),
+                        score=(max_hyp.score + logp),
                         y_sequence=max_hyp.y_sequence[:],
                         dec_state=max_hyp.dec_state,
                         lm_state=max_hyp.lm_state,
@@ -644,7 +649,7 @@ class BeamRNNTInfer(Typing):
                     else:
                         # if non-blank token was predicted, update state and sequence and then search more hypothesis
                         new_hyp.dec_state = state
-                        new_hyp.y_sequence.append(int(k))
+                        new_hyp.y_sequence.append(k)
                         new_hyp.timestep.append(i)
 
                         hyps.append(new_hyp)
@@ -708,19 +713,21 @@ class BeamRNNTInfer(Typing):
             raise NotImplementedError("`partial_hypotheses` support is not supported")
 
         # Precompute some constants for blank position
-        ids = list(range(self.vocab_size + 1))
-        ids.remove(self.blank)
-
         # Used when blank token is first vs last token
         if self.blank == 0:
             index_incr = 1
         else:
             index_incr = 0
 
+        # Non-blank tokens are contiguous: select them with a slice (view)
+        # instead of an index list, which is copied to the device on every step
+        ids = slice(index_incr, index_incr + self.vocab_size)
+
         # prepare the batched beam states
         beam = min(self.beam_size, self.vocab_size)
+        # only the state of the first (blank) hypothesis is used, initialize a single element
         beam_state = self.decoder.initialize_state(
-            torch.zeros(beam, device=h.device, dtype=h.dtype)
+            torch.zeros(1, device=h.device, dtype=h.dtype)
         )  # [L, B, H], [L, B, H] (for LSTMs)
 
         # Initialize first hypothesis for the beam (blank)
@@ -761,17 +768,24 @@ class BeamRNNTInfer(Typing):
                     self.joint.joint(h_enc, torch.stack(beam_y)) / self.softmax_temperature, dim=-1
                 )  # [B, 1, 1, V + 1]
                 beam_logp = beam_logp[:, 0, 0, :]  # [B, V + 1]
-                beam_topk = beam_logp[:, ids].topk(beam, dim=-1)
+                beam_topk = beam_logp[:, ids].topk(beam, dim=-1, sorted=False)
+                # read the scores and ids of the candidates to host once, instead of synchronizing for each candidate
+                beam_blank_logp = beam_logp[:, self.blank].tolist()
+                beam_topk_logp, beam_topk_ids = beam_topk[0].tolist(), (beam_topk[1] + index_incr).tolist()
 
-                seq_A = [h.y_sequence for h in A]
+                # map output sequences of A to their positions, so that merging does not scan the list;
+                # duplicates keep the first position, as `list.index` did
+                seq_A = {}
+                for pos, h in enumerate(A):
+                    seq_A.setdefault(tuple(h.y_sequence), pos)
 
                 for j, hyp in enumerate(C):
                     # create a new hypothesis in A
-                    if hyp.y_sequence not in seq_A:
+                    if tuple(hyp.y_sequence) not in seq_A:
                         # If the sequence is not in seq_A, add it as the blank token
                         # In this step, we dont add a token but simply update score
                         _temp_hyp = Hypothesis(
-                            score=(hyp.score + float(beam_logp[j, self.blank])),
+                            score=(hyp.score + beam_blank_logp[j]),
                             y_sequence=hyp.y_sequence[:],
                             dec_state=hyp.dec_state,
                             lm_state=hyp.lm_state,
@@ -789,22 +803,22 @@ class BeamRNNTInfer(Typing):
                         A.append(_temp_hyp)
                     else:
                         # merge the existing blank hypothesis score with current score.
-                        dict_pos = seq_A.index(hyp.y_sequence)
+                        dict_pos = seq_A[tuple(hyp.y_sequence)]
 
                         A[dict_pos].score = np.logaddexp(
-                            A[dict_pos].score, (hyp.score + float(beam_logp[j, self.blank]))
+                            A[dict_pos].score, (hyp.score + beam_blank_logp[j])
                         )
 
                 if v < self.tsd_max_symmetric_expansion_per_step:
                     for j, hyp in enumerate(C):
                         # for each current hypothesis j
                         # extract the top token score and top token id for the jth hypothesis
-                        for logp, k in zip(beam_topk[0][j], beam_topk[1][j] + index_incr):
+                        for logp, k in zip(beam_topk_logp[j], beam_topk_ids[j]):
                             # create new hypothesis and store in D
                             # Note: This loop does *not* include the blank token!
                             new_hyp = Hypothesis(
-                                score=(hyp.score + float(logp)),
-                                y_sequence=(hyp.y_sequence + [int(k)]),
+                                score=(hyp.score + logp),
+                                y_sequence=(hyp.y_sequence + [k]),
                                 dec_state=beam_state[j],
                                 lm_state=hyp.lm_state,
                                 timestep=hyp.timestep[:] + [i],
@@ -871,22 +885,24 @@ class BeamRNNTInfer(Typing):
             raise NotImplementedError("`partial_hypotheses` support is not supported")
 
         # Precompute some constants for blank position
-        ids = list(range(self.vocab_size + 1))
-        ids.remove(self.blank)
-
         # Used when blank token is first vs last token
         if self.blank == 0:
             index_incr = 1
         else:
             index_incr = 0
 
+        # Non-blank tokens are contiguous: select them with a slice (view)
+        # instead of an index list, which is copied to the device on every step
+        ids = slice(index_incr, index_incr + self.vocab_size)
+
         # prepare the batched beam states
         beam = min(self.beam_size, self.vocab_size)
 
         h = h[0]  # [T, D]
         h_length = int(encoded_lengths)
+        # only the state of the first (blank) hypothesis is used, initialize a single element
         beam_state = self.decoder.initialize_state(
-            torch.zeros(beam, device=h.device, dtype=h.dtype)
+            torch.zeros(1, device=h.device, dtype=h.dtype)
         )  # [L, B, H], [L, B, H] for LSTMS
         beam_state = [self.decoder.batch_select_state(beam_state, 0)]
 
@@ -937,7 +953,7 @@ class BeamRNNTInfer(Typing):
                     continue
 
                 B_.append(hyp)
-                h_states.append((t, h[t]))
+                h_states.append(t)
 
             if B_:
                 # Compute the subset of batch ids which were *not* removed from the list above
@@ -978,10 +994,9 @@ class BeamRNNTInfer(Typing):
                     # If entire batch was updated, simply update all the states
                     beam_state = beam_state_
 
-                # h_states = list of [t, h[t]]
-                # so h[1] here is a h[t] of shape [D]
-                # Simply stack all of the h[t] within the sub_batch/batch (T <= beam)
-                h_enc = torch.stack([h[1] for h in h_states])  # [T=beam, D]
+                # h_states = list of time steps t of the sub_batch/batch (T <= beam)
+                # Gather all of the h[t] of shape [D] with a single index_select instead of stacking per-step views
+                h_enc = h.index_select(0, torch.tensor(h_states, dtype=torch.long, device=h.device))  # [T=beam, D]
                 h_enc = h_enc.unsqueeze(1)  # [B=beam, T=1, D]; batch over the beams
 
                 # Extract the log probabilities and the predicted tokens
@@ -989,13 +1004,16 @@ class BeamRNNTInfer(Typing):
                     self.joint.joint(h_enc, torch.stack(beam_y)) / self.softmax_temperature, dim=-1
                 )  # [B=beam, 1, 1, V + 1]
                 beam_logp = beam_logp[:, 0, 0, :]  # [B=beam, V + 1]
-                beam_topk = beam_logp[:, ids].topk(beam, dim=-1)
+                beam_topk = beam_logp[:, ids].topk(beam, dim=-1, sorted=False)
+                # read the scores and ids of the candidates to host once, instead of synchronizing for each candidate
+                beam_blank_logp = beam_logp[:, self.blank].tolist()
+                beam_topk_logp, beam_topk_ids = beam_topk[0].tolist(), (beam_topk[1] + index_incr).tolist()
 
                 for j, hyp in enumerate(B_):
                     # For all updated samples in the batch, add it as the blank token
                     # In this step, we dont add a token but simply update score
                     new_hyp = Hypothesis(
-                        score=(hyp.score + float(beam_logp[j, self.blank])),
+                        score=(hyp.score + beam_blank_logp[j]),
                         y_sequence=hyp.y_sequence[:],
                         dec_state=hyp.dec_state,
                         lm_state=hyp.lm_state,
@@ -1016,7 +1034,7 @@ class BeamRNNTInfer(Typing):
 
                     # If the prediction "timestep" t has reached the length of the input sequence
                     # we can add it to the "finished" hypothesis list.
-                    if h_states[j][0] == (h_length - 1):
+                    if h_states[j] == (h_length - 1):
                         final.append(new_hyp)
 
                     # Here, we carefully select the indices of the states that we want to preserve
@@ -1028,12 +1046,12 @@ class BeamRNNTInfer(Typing):
 
                     # for each current hypothesis j
                     # extract the top token score and top token id for the jth hypothesis
-                    for logp, k in zip(beam_topk[0][j], beam_topk[1][j] + index_incr):
+                    for logp, k in zip(beam_topk_logp[j], beam_topk_ids[j]):
                         # create new hypothesis and store in A
                         # Note: This loop does *not* include the blank token!
                         new_hyp = Hypothesis(
-                            score=(hyp.score + float(logp)),
-                            y_sequence=(hyp.y_sequence[:] + [int(k)]),
+                            score=(hyp.score + logp),
+                            y_sequence=(hyp.y_sequence[:] + [k]),
                             dec_state=beam_state[h_states_idx],
                             lm_state=hyp.lm_state,
                             timestep=hyp.timestep[:] + [i],
@@ -1188,7 +1206,7 @@ class BeamRNNTInfer(Typing):
 
             # List that contains the blank token emisions
             list_b = []
-            duplication_check = [hyp.y_sequence for hyp in hyps]
+            duplication_check = {tuple(hyp.y_sequence) for hyp in hyps}
 
             # Repeat for number of mAES steps
             for n in range(self.maes_num_steps):
@@ -1197,7 +1215,7 @@ class BeamRNNTInfer(Typing):
 
                 # Extract the log probabilities
                 ytm, ilm_ytm = self.resolve_joint_output(beam_enc_out, beam_dec_out)
-                beam_logp, beam_idx = ytm.topk(self.max_candidates, dim=-1)
+                beam_logp, beam_idx = ytm.topk(self.max_candidates, dim=-1, sorted=False)
 
                 beam_logp = beam_logp[:, 0, 0, :]  # [B, V + 1]
                 beam_idx = beam_idx[:, 0, 0, :]  # [B, max_candidates]
@@ -1230,7 +1248,7 @@ class BeamRNNTInfer(Typing):
                         else:
                             # If the expansion was a token
                             # new_hyp.y_sequence.append(int(k))
-                            if (new_hyp.y_sequence + [int(k)]) not in duplication_check:
+                            if (tuple(new_hyp.y_sequence) + (int(k),)) not in duplication_check:
                                 new_hyp.y_sequence.append(int(k))
                                 new_hyp.timestep.append(t)
 
@@ -1391,15 +1409,19 @@ class BeamRNNTInfer(Typing):
            final (list): list of recombined hypotheses
         """
         final = []
+        # map output sequences to their positions in `final`
+        seq_final = {}
 
         for hyp in hypotheses:
-            seq_final = [f.y_sequence for f in final if f.y_sequence]
+            seq = tuple(hyp.y_sequence)
 
-            if hyp.y_sequence in seq_final:
-                seq_pos = seq_final.index(hyp.y_sequence)
+            if seq in seq_final:
+                seq_pos = seq_final[seq]
 
                 final[seq_pos].score = np.logaddexp(final[seq_pos].score, hyp.score)
             else:
+                if seq:
+                    seq_final[seq] = len(final)
                 final.append(hyp)
 
         return final
@@ -1436,31 +1458,30 @@ class BeamRNNTInfer(Typing):
                 pref_id = len(hyp_i.y_sequence)
 
                 if is_prefix(hyp_j.y_sequence, hyp_i.y_sequence) and (curr_id - pref_id) <= prefix_alpha:
-                    logp, ilm_logp = self.resolve_joint_output(enc_out, hyp_i.dec_out[-1])
-                    logp = logp[0, 0, 0, :]
-                    curr_score = hyp_i.score + float(logp[hyp_j.y_sequence[pref_id]])
-                    # Setup ngram LM:
-                    if self.ngram_lm:
-                        lm_score, next_state = self.compute_ngram_score(
-                            hyp_i.ngram_lm_state, int(hyp_j.y_sequence[pref_id])
-                        )
-                        if self.hat_subtract_ilm:
-                            curr_score += self.ngram_lm_alpha * lm_score - self.hat_ilm_weight * float(
-                                ilm_logp[0, 0, hyp_j.y_sequence[pref_id]]
-                            )
-                        else:
-                            curr_score += self.ngram_lm_alpha * lm_score
+                    # Score all the tokens that follow the prefix with a single joint call: the first token uses
+                    # the decoder output of the prefix hypothesis, the next ones use the decoder outputs stored
+                    # in the current hypothesis.
+                    tokens = hyp_j.y_sequence[pref_id:curr_id]
+                    dec_out = torch.stack([hyp_i.dec_out[-1]] + hyp_j.dec_out[pref_id : (curr_id - 1)])
+                    logp, ilm_logp = self.resolve_joint_output(enc_out, dec_out)
+                    tokens_logp = (
+                        logp[:, 0, 0, :]
+                        .gather(dim=-1, index=torch.tensor(tokens, device=logp.device).unsqueeze(-1))
+                        .squeeze(-1)
+                        .tolist()
+                    )
 
-                    for k in range(pref_id, (curr_id - 1)):
-                        logp, ilm_logp = self.resolve_joint_output(enc_out, hyp_j.dec_out[k])
-                        logp = logp[0, 0, 0, :]
-                        curr_score += float(logp[hyp_j.y_sequence[k + 1]])
+                    curr_score = hyp_i.score
+                    for k, token in enumerate(tokens):
+                        curr_score += tokens_logp[k]
                         # Setup ngram LM:
                         if self.ngram_lm:
-                            lm_score, next_state = self.compute_ngram_score(next_state, int(hyp_j.y_sequence[k + 1]))
+                            lm_score, next_state = self.compute_ngram_score(
+                                hyp_i.ngram_lm_state if k == 0 else next_state, int(token)
+                            )
                             if self.hat_subtract_ilm:
                                 curr_score += self.ngram_lm_alpha * lm_score - self.hat_ilm_weight * float(
-                                    ilm_logp[0, 0, hyp_j.y_sequence[k + 1]]
+                                    ilm_logp[k, 0, 0, token]
                                 )
                             else:
                                 curr_score += self.ngram_lm_alpha * lm_score
@@ -369,29 +369,39 @@ class BeamTDTInfer(Typing):
                 logits = (
                     self.joint.joint(encoder_output, decoder_output) / self.softmax_temperature
                 )  # [1, 1, 1, V + NUM_DURATIONS + 1]
-                logp = torch.log_softmax(logits[0, 0, 0, : -len(self.durations)], dim=-1)  # [V + 1]
+                # Token log-probabilities differ from the logits only by the log-normalizer,
+                # so candidates are selected on the logits and only the selected ones are normalized.
+                logits_tokens = logits[0, 0, 0, : -len(self.durations)]  # [V + 1]
+                log_normalizer = torch.logsumexp(logits_tokens, dim=-1)
                 durations_logp = torch.log_softmax(logits[0, 0, 0, -len(self.durations) :], dim=-1)  # [NUM_DURATIONS]
 
                 # Proccess non-blank tokens
                 # Retrieve the top `beam_k` most probable tokens and the top `duration_beam_k` most probable durations.
                 # Then, select the top `beam_k` pairs of (token, duration) based on the highest combined probabilities.
                 # Note that indices are obtained in the flattened array.
-                logp_topks, logp_topk_idxs = logp[:-1].topk(beam_k, dim=-1)  # topk of tokens without blank token
+                logp_topks, logp_topk_idxs = logits_tokens[:-1].topk(beam_k, dim=-1)  # topk of tokens without blank
+                logp_topks = logp_topks - log_normalizer
                 durations_logp_topks, durations_logp_topk_idxs = durations_logp.topk(durations_beam_k, dim=-1)
+                # Broadcasted sum has the same flattened order as a cartesian product, without materializing pairs
                 total_logp_topks, total_logp_topk_idxs = (
-                    torch.cartesian_prod(durations_logp_topks, logp_topks).sum(dim=-1).topk(beam_k, dim=-1)
+                    (durations_logp_topks[:, None] + logp_topks[None, :]).view(-1).topk(beam_k, dim=-1)
                 )
 
+                # Read the candidates to host once, instead of synchronizing for each element
+                total_logp_topks, total_logp_topk_idxs = total_logp_topks.tolist(), total_logp_topk_idxs.tolist()
+                logp_topk_idxs, durations_logp_topk_idxs = logp_topk_idxs.tolist(), durations_logp_topk_idxs.tolist()
+                blank_logp, durations_logp = float(logits_tokens[self.blank] - log_normalizer), durations_logp.tolist()
+
                 # Loop over pairs of (token, duration) with highest combined log prob
                 for total_logp_topk, total_logp_topk_idx in zip(total_logp_topks, total_logp_topk_idxs):
                     # Restore indices from flattened array indices
-                    token_idx = int(logp_topk_idxs[total_logp_topk_idx % beam_k])
-                    duration_idx = int(durations_logp_topk_idxs[total_logp_topk_idx // beam_k])
+                    token_idx = logp_topk_idxs[total_logp_topk_idx % beam_k]
+                    duration_idx = durations_logp_topk_idxs[total_logp_topk_idx // beam_k]
 
                     duration = self.durations[duration_idx]
                     # Construct hypothesis for non-blank token
                     new_hyp = Hypothesis(
-                        score=float(max_hyp.score + total_logp_topk),  # update score
+                        score=max_hyp.score + total_logp_topk,  # update score
                         y_sequence=max_hyp.y_sequence + [token_idx],  # update hypothesis sequence
                         dec_state=decoder_state,  # update decoder state
                         timestep=max_hyp.timestep + [time_idx + duration],  # update timesteps
@@ -408,17 +418,16 @@ class BeamTDTInfer(Typing):
                 # Update future frames with blank tokens
                 # Note: blank token can have only non-zero duration
                 for duration_idx in durations_logp_topk_idxs:
-                    duration_idx = int(duration_idx)
                     # If zero is the only duration in topk, switch to closest non-zero duration to continue
                     if duration_idx == self.zero_duration_idx:
-                        if durations_logp_topk_idxs.shape[0] == 1:
+                        if len(durations_logp_topk_idxs) == 1:
                             duration_idx = self.min_non_zero_duration_idx
                         else:
                             continue
 
                     duration = self.durations[duration_idx]
                     new_hyp = Hypothesis(
-                        score=float(max_hyp.score + logp[self.blank] + durations_logp[duration_idx]),  # update score
+                        score=max_hyp.score + blank_logp + durations_logp[duration_idx],  # update score
                         y_sequence=max_hyp.y_sequence[:],  # no need to update sequence
                         dec_state=max_hyp.dec_state,  # no need to update decoder state
                         timestep=max_hyp.timestep[:],  # no need to update timesteps
@@ -547,12 +556,13 @@ class BeamTDTInfer(Typing):
                 # Then, select the top `max_candidates` pairs of (token, duration)
                 # based on the highest combined probabilities.
                 # Note that indices are obtained in flattened array.
-                beam_logp_topks, beam_idx_topks = beam_logp.topk(self.max_candidates, dim=-1)
+                # Candidates are pruned by value and re-sorted by score later, so topk order is not needed.
+                beam_logp_topks, beam_idx_topks = beam_logp.topk(self.max_candidates, dim=-1, sorted=False)
                 beam_total_logp = (beam_duration_logp[:, :, None] + beam_logp_topks[:, None, :]).view(
                     len(hyps), -1
                 )  # [B, MAX_CANDIDATES*DURATION_BEAM]
                 beam_total_logp_topks, beam_total_logp_topk_idxs = beam_total_logp.topk(
-                    self.max_candidates, dim=-1
+                    self.max_candidates, dim=-1, sorted=False
                 )  # [B, MAX_CANDIDATES]
 
                 # Prune hypothesis to obtain k expansions
@@ -729,33 +739,29 @@ class BeamTDTInfer(Typing):
                     is_prefix(curr_hyp.y_sequence, pref_hyp.y_sequence)
                     and (curr_hyp_length - pref_hyp_length) <= prefix_alpha
                 ):
-                    # Compute the score of the first token
-                    # that follows the prefix hypothesis tokens in current hypothesis.
-                    # Use the decoder output, which is stored in the prefix hypothesis.
-                    logits = self.joint.joint(encoder_output, pref_hyp.dec_out[-1]) / self.softmax_temperature
-                    logp = torch.log_softmax(logits[0, 0, 0, : -len(self.durations)], dim=-1)
-                    duration_logp = torch.log_softmax(logits[0, 0, 0, -len(self.durations) :], dim=-1)
-                    curr_score = pref_hyp.score + float(
-                        logp[curr_hyp.y_sequence[pref_hyp_length]] + duration_logp[self.zero_duration_idx]
+                    # Compute the scores of all the tokens that follow the prefix hypothesis tokens
+                    # in current hypothesis with a single joint call.
+                    # The first token uses the decoder output, which is stored in the prefix hypothesis.
+                    # The next ones approximate decoder output with the one that is stored in current hypothesis.
+                    tokens = curr_hyp.y_sequence[pref_hyp_length:curr_hyp_length]
+                    decoder_output = torch.stack(
+                        [pref_hyp.dec_out[-1]] + curr_hyp.dec_out[pref_hyp_length : (curr_hyp_length - 1)]
                     )
-
-                    if self.ngram_lm:
-                        lm_score, next_state = self.compute_ngram_score(
-                            pref_hyp.ngram_lm_state, int(curr_hyp.y_sequence[pref_hyp_length])
-                        )
-                        curr_score += self.ngram_lm_alpha * lm_score
-
-                    for k in range(pref_hyp_length, (curr_hyp_length - 1)):
-                        # Compute the score of the next token.
-                        # Approximate decoder output with the one that is stored in current hypothesis.
-                        logits = self.joint.joint(encoder_output, curr_hyp.dec_out[k]) / self.softmax_temperature
-                        logp = torch.log_softmax(logits[0, 0, 0, : -len(self.durations)], dim=-1)
-                        duration_logp = torch.log_softmax(logits[0, 0, 0, -len(self.durations) :], dim=-1)
-                        curr_score += float(logp[curr_hyp.y_sequence[k + 1]] + duration_logp[self.zero_duration_idx])
+                    logits = self.joint.joint(encoder_output, decoder_output) / self.softmax_temperature
+                    logp = torch.log_softmax(logits[:, 0, 0, : -len(self.durations)], dim=-1)
+                    duration_logp = torch.log_softmax(logits[:, 0, 0, -len(self.durations) :], dim=-1)
+                    tokens_logp = (
+                        logp.gather(dim=-1, index=torch.tensor(tokens, device=logp.device).unsqueeze(-1)).squeeze(-1)
+                        + duration_logp[:, self.zero_duration_idx]
+                    ).tolist()
+
+                    curr_score = pref_hyp.score
+                    for k, token in enumerate(tokens):
+                        curr_score += tokens_logp[k]
 
                         if self.ngram_lm:
                             lm_score, next_state = self.compute_ngram_score(
-                                next_state, int(curr_hyp.y_sequence[k + 1])
+                                pref_hyp.ngram_lm_state if k == 0 else next_state, int(token)
                             )
                             curr_score += self.ngram_lm_alpha * lm_score
 
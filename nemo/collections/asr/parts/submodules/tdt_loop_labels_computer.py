@@ -64,6 +64,8 @@ class LoopLabelsState:
 
     time_indices: torch.Tensor  # current time indices for each element in batch
     safe_time_indices: torch.Tensor  # current time indices, but guaranteed to be < encoder_output_length
+    # view of `safe_time_indices` expanded to [B, 1, D], index to gather current encoder frames
+    safe_time_indices_expanded: torch.Tensor
     time_indices_current_labels: torch.Tensor  # time indices for found labels (corresponding to `labels` field)
     last_timesteps: torch.Tensor  # indices of the last timesteps for each element (encoder_output_length - 1)
 
@@ -79,6 +81,7 @@ class LoopLabelsState:
 
     last_decoder_state: Any  # last state from the decoder, needed for the output
     decoder_state: Any  # current decoder state
+    initial_decoder_state: Any  # initial decoder state (constant), used to reset the current state
     decoder_output: torch.Tensor  # output from the decoder (projected)
 
     batched_hyps: rnnt_utils.BatchedHyps  # batched hypotheses - decoding result
@@ -131,6 +134,7 @@ class LoopLabelsState:
 
         self.time_indices = torch.zeros_like(self.batch_indices)
         self.safe_time_indices = torch.zeros_like(self.batch_indices)
+        self.safe_time_indices_expanded = self.safe_time_indices.view(-1, 1, 1).expand(-1, 1, encoder_dim)
         self.time_indices_current_labels = torch.zeros_like(self.time_indices)
         self.last_timesteps = torch.zeros_like(self.time_indices)
 
@@ -325,6 +329,9 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
 
         # do not recalculate joint projection, project only once
         encoder_output_projected = self.joint.project_encoder(encoder_output)
+        if torch.is_autocast_enabled():
+            # run the joint and store the scores in reduced precision, same as in the CUDA graphs implementation
+            encoder_output_projected = encoder_output_projected.to(torch.get_autocast_gpu_dtype())
         float_dtype = encoder_output_projected.dtype
 
         # init output structures: BatchedHyps (for results), BatchedAlignments + last decoder state
@@ -351,8 +358,10 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
             with_duration_confidence=self.include_duration_confidence,
         )
 
-        # durations
-        all_durations = self.durations.to(device, non_blocking=True)
+        # durations: keep on the decoding device, to avoid a host-to-device copy on each call
+        if self.durations.device != device:
+            self.durations = self.durations.to(device)
+        all_durations = self.durations
         num_durations = all_durations.shape[0]
 
         # initial state, needed for torch.jit to compile (cannot handle None)
@@ -361,16 +370,24 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
         batch_indices = torch.arange(batch_size, dtype=torch.long, device=device)
         # last found labels - initially <SOS> (<blank>) symbol
         labels = torch.full_like(batch_indices, fill_value=self._SOS)
+        # scores for last found labels, stored in the joint output dtype, which can differ from `float_dtype`
+        # (e.g., log-softmax under autocast); a joint call on an empty batch is enough to get it
+        empty_projected = encoder_output_projected[:0, :1]
+        joint_dtype = self.joint.joint_after_projection(empty_projected, empty_projected).dtype
+        scores = torch.zeros_like(batch_indices, dtype=joint_dtype)
 
         # time indices
         time_indices = torch.zeros_like(batch_indices)
         safe_time_indices = torch.zeros_like(time_indices)  # time indices, guaranteed to be < out_len
+        # index to gather current encoder frames (view of safe_time_indices, in-place updates are reflected)
+        safe_time_indices_expanded = safe_time_indices.view(-1, 1, 1).expand(-1, 1, encoder_output_projected.shape[-1])
         time_indices_current_labels = torch.zeros_like(time_indices)
         last_timesteps = encoder_output_length - 1
 
         # masks for utterances in batch
         active_mask: torch.Tensor = encoder_output_length > 0
         advance_mask = torch.empty_like(active_mask)
+        blank_mask = torch.empty_like(active_mask)
 
         # for storing the last state we need to know what elements became "inactive" on this step
         active_mask_prev = torch.empty_like(active_mask)
@@ -387,68 +404,17 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
 
             # stage 2: get joint output, iteratively seeking for non-blank labels
             # blank label in `labels` tensor means "end of hypothesis" (for this index)
-            logits = (
-                self.joint.joint_after_projection(
-                    encoder_output_projected[batch_indices, safe_time_indices].unsqueeze(1),
-                    decoder_output,
-                )
-                .squeeze(1)
-                .squeeze(1)
-            )
-            scores, labels = logits[:, :-num_durations].max(dim=-1)
-            jump_durations_indices = logits[:, -num_durations:].argmax(dim=-1)
-            durations = all_durations[jump_durations_indices]
-
-            # search for non-blank labels using joint, advancing time indices for blank labels
-            # checking max_symbols is not needed, since we already forced advancing time indices for such cases
-            blank_mask = labels == self._blank_index
-            # for blank labels force duration >= 1
-            durations.masked_fill_(torch.logical_and(durations == 0, blank_mask), 1)
-            time_indices_current_labels.copy_(time_indices, non_blocking=True)
-            if use_alignments:
-                alignments.add_results_masked_(
-                    active_mask=active_mask,
-                    time_indices=time_indices_current_labels,
-                    logits=logits if self.preserve_alignments else None,
-                    labels=labels if self.preserve_alignments else None,
-                    confidence=(
-                        torch.stack(
-                            (
-                                self._get_confidence_tensor(F.log_softmax(logits[:, :-num_durations], dim=-1)).to(
-                                    dtype=float_dtype
-                                ),
-                                self._get_confidence_tensor(F.log_softmax(logits[:, -num_durations:], dim=-1)).to(
-                                    dtype=float_dtype
-                                ),
-                            ),
-                            dim=-1,
-                        )
-                        if self.include_duration_confidence
-                        else (
-                            self._get_confidence_tensor(F.log_softmax(logits[:, :-num_durations], dim=-1)).to(
-                                dtype=float_dtype
-                            )
-                            if self.preserve_frame_confidence
-                            else None
-                        )
-                    ),
-                )
-
             # advance_mask is a mask for current batch for searching non-blank labels;
-            # each element is True if non-blank symbol is not yet found AND we can increase the time index
-            time_indices += durations
-            torch.minimum(time_indices, last_timesteps, out=safe_time_indices)
-            torch.less(time_indices, encoder_output_length, out=active_mask)
-            torch.logical_and(active_mask, blank_mask, out=advance_mask)
-
-            # inner loop: find next non-blank labels (if exist)
-            while advance_mask.any():
+            # on the first iteration all active elements are processed, then only those
+            # for which non-blank symbol is not yet found AND we can increase the time index
+            advance_mask.copy_(active_mask, non_blocking=True)
+            while True:
                 # same as: time_indices_current_labels[advance_mask] = time_indices[advance_mask], but non-blocking
                 # store current time indices to use further for storing the results
                 torch.where(advance_mask, time_indices, time_indices_current_labels, out=time_indices_current_labels)
                 logits = (
                     self.joint.joint_after_projection(
-                        encoder_output_projected[batch_indices, safe_time_indices].unsqueeze(1),
+                        encoder_output_projected.gather(dim=1, index=safe_time_indices_expanded),
                         decoder_output,
                     )
                     .squeeze(1)
@@ -493,7 +459,8 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
                         ),
                     )
 
-                blank_mask = labels == self._blank_index
+                # same as: blank_mask = labels == self._blank_index, but without allocation
+                torch.eq(labels, self._blank_index, out=blank_mask)
                 # for blank labels force duration >= 1
                 durations.masked_fill_(torch.logical_and(durations == 0, blank_mask), 1)
                 # same as time_indices[advance_mask] += durations[advance_mask], but non-blocking
@@ -501,6 +468,8 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
                 torch.minimum(time_indices, last_timesteps, out=safe_time_indices)
                 torch.less(time_indices, encoder_output_length, out=active_mask)
                 torch.logical_and(active_mask, blank_mask, out=advance_mask)
+                if not advance_mask.any():
+                    break
 
             # stage 3: filter labels and state, store hypotheses
             # select states for hyps that became inactive (is it necessary?)
@@ -675,6 +644,8 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
 
         self.state.last_decoder_state = self.decoder.initialize_state(encoder_output_projected)
         self.state.decoder_state = self.decoder.initialize_state(encoder_output_projected)
+        # initial state does not depend on the data, initialize once instead of on each decoding call
+        self.state.initial_decoder_state = self.decoder.initialize_state(self.state.encoder_output_projected)
         decoder_output, *_ = self.decoder.predict(
             self.state.labels.unsqueeze(1), self.state.decoder_state, add_sos=False, batch_size=self.state.batch_size
         )
@@ -696,11 +667,17 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
         stream_for_graph = torch.cuda.Stream(self.state.device)
         stream_for_graph.wait_stream(torch.cuda.default_stream(self.state.device))
         self.separate_graphs = SeparateGraphsLoopLabels()
+        # The graphs are always replayed one after another on the same stream, and all the tensors passed between them
+        # are preallocated in the state, so they can share one memory pool for their intermediate tensors
+        graph_pool = torch.cuda.graph_pool_handle()
         with (
             torch.cuda.stream(stream_for_graph),
             torch.inference_mode(),
             torch.cuda.graph(
-                self.separate_graphs.before_outer_loop, stream=stream_for_graph, capture_error_mode="thread_local"
+                self.separate_graphs.before_outer_loop,
+                pool=graph_pool,
+                stream=stream_for_graph,
+                capture_error_mode="thread_local",
             ),
         ):
             self._before_outer_loop()
@@ -709,7 +686,10 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
             torch.cuda.stream(stream_for_graph),
             torch.inference_mode(),
             torch.cuda.graph(
-                self.separate_graphs.before_inner_loop, stream=stream_for_graph, capture_error_mode="thread_local"
+                self.separate_graphs.before_inner_loop,
+                pool=graph_pool,
+                stream=stream_for_graph,
+                capture_error_mode="thread_local",
             ),
         ):
             self._before_inner_loop_get_decoder_output()
@@ -719,7 +699,10 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
             torch.cuda.stream(stream_for_graph),
             torch.inference_mode(),
             torch.cuda.graph(
-                self.separate_graphs.inner_loop_code, stream=stream_for_graph, capture_error_mode="thread_local"
+                self.separate_graphs.inner_loop_code,
+                pool=graph_pool,
+                stream=stream_for_graph,
+                capture_error_mode="thread_local",
             ),
         ):
             self._inner_loop_code()
@@ -728,7 +711,10 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
             torch.cuda.stream(stream_for_graph),
             torch.inference_mode(),
             torch.cuda.graph(
-                self.separate_graphs.after_inner_loop, stream=stream_for_graph, capture_error_mode="thread_local"
+                self.separate_graphs.after_inner_loop,
+                pool=graph_pool,
+                stream=stream_for_graph,
+                capture_error_mode="thread_local",
             ),
         ):
             self._after_inner_loop()
@@ -792,7 +778,7 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
 
         # initial state
         self.decoder.batch_replace_states_all(
-            src_states=self.decoder.initialize_state(self.state.encoder_output_projected),
+            src_states=self.state.initial_decoder_state,
             dst_states=self.state.decoder_state,
         )
         # last found labels - initially <SOS> (<blank>) symbol
@@ -830,9 +816,7 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
         self.state.active_mask_prev.copy_(self.state.active_mask, non_blocking=True)
         logits = (
             self.joint.joint_after_projection(
-                self.state.encoder_output_projected[self.state.batch_indices, self.state.safe_time_indices].unsqueeze(
-                    1
-                ),
+                self.state.encoder_output_projected.gather(dim=1, index=self.state.safe_time_indices_expanded),
                 self.state.decoder_output,
             )
             .squeeze(1)
@@ -904,9 +888,7 @@ class GreedyBatchedTDTLoopLabelsComputer(WithOptionalCudaGraphs, ConfidenceMetho
         )
         logits = (
             self.joint.joint_after_projection(
-                self.state.encoder_output_projected[self.state.batch_indices, self.state.safe_time_indices].unsqueeze(
-                    1
-                ),
+                self.state.encoder_output_projected.gather(dim=1, index=self.state.safe_time_indices_expanded),
                 self.state.decoder_output,
             )
             .squeeze(1)
@@ -25,6 +25,7 @@ from jiwer import wer as word_error_rate
 from omegaconf import DictConfig
 
 from nemo.collections.asr.parts.utils.wfst_utils import TW_BREAK, kaldifst_importer
+from nemo.utils import logging
 
 RIVA_DECODER_INSTALLATION_MESSAGE = (
     "riva decoder is not installed or is installed incorrectly.\n"
@@ -735,7 +736,7 @@ class RivaGpuWfstDecoder(AbstractWFSTDecoder):
             self.lm_weight = lm_weight / 10
             hypotheses = self.decode(log_probs, log_probs_length)
             wer = word_error_rate([" ".join(h[0].words) for h in hypotheses], reference_texts)
-            print(lm_weight, wer)
+            logging.debug(f"lm_weight: {self.lm_weight}, wer: {wer}")
             if wer < best_wer:
                 best_lm_weight, best_wer = self.lm_weight, wer
         self.decoding_mode = decoding_mode_backup
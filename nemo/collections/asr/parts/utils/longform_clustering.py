@@ -25,7 +25,7 @@ from nemo.collections.asr.parts.utils.online_clustering import get_merge_quantit
 
 
 class LongFormSpeakerClustering(torch.nn.Module):
-    def __init__(self, cuda: bool = False):
+    def __init__(self, cuda: bool = False, fp16_affinity: bool = False):
         """
         Initializes a speaker clustering class tailored for long-form audio, leveraging methods from the `SpeakerClustering` class.
         The clustering algorithm for long-form content is executed via the `forward_infer` function (not shown here). Input embedding 
@@ -38,12 +38,15 @@ class LongFormSpeakerClustering(torch.nn.Module):
         Args:
             cuda (bool):
                 Flag indicating whether CUDA is available for computation.
+            fp16_affinity (bool):
+                Flag indicating whether cosine affinity matrices are calculated in FP16 on CUDA.
         """
         super().__init__()
-        self.speaker_clustering = SpeakerClustering(cuda=cuda)
+        self.speaker_clustering = SpeakerClustering(cuda=cuda, fp16_affinity=fp16_affinity)
         self.embeddings_in_scales: List[torch.Tensor] = [torch.tensor([0])]
         self.timestamps_in_scales: List[torch.Tensor] = [torch.tensor([0])]
         self.cuda = cuda
+        self.fp16_affinity = fp16_affinity
         self.device = torch.device("cuda") if self.cuda else torch.device("cpu")
 
     def check_input(self, embeddings_per_chunk: int, chunk_cluster_count: int, max_num_speakers: int) -> None:
@@ -300,7 +303,7 @@ class LongFormSpeakerClustering(torch.nn.Module):
             if emb_part.shape[0] == 1:
                 Y_part = torch.zeros((1,), dtype=torch.int64)
             else:
-                mat = getCosAffinityMatrix(emb_part)
+                mat = getCosAffinityMatrix(emb_part, fp16_affinity=self.fp16_affinity)
                 overcluster_count = min(chunk_cluster_count, mat.shape[0])
                 Y_part = self.speaker_clustering.forward_unit_infer(
                     mat=mat,
@@ -341,7 +344,7 @@ class LongFormSpeakerClustering(torch.nn.Module):
 
         # Concatenate the reduced embeddings then perform high-level clustering
         reduced_embs = torch.cat(total_emb)
-        reduced_mat = getCosAffinityMatrix(reduced_embs)
+        reduced_mat = getCosAffinityMatrix(reduced_embs, fp16_affinity=self.fp16_affinity)
 
         # Step-4: Map the aggregated labels `Y_aggr` back to the original labels for all `org_len` input embeddings: `Y_unpack`
         Y_aggr = self.speaker_clustering.forward_unit_infer(
@@ -86,3 +86,27 @@ def _phase_vocoder_kernel(D, time_steps, phi_advance, d_stretch, phase_acc, scal
         phase_acc += phi_advance + dphase
 
     return d_stretch
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def count_mapped_labels(mapping: np.ndarray, labels: np.ndarray, num_segs: int, num_labels: int):
+    """
+    Numba optimized kernel that counts how many times each label is mapped to each target segment
+    and records where each label first appears in each target segment.
+    Args:
+        mapping: Integer ndarray of target segment indices, shape = [n]
+        labels: Integer ndarray of non-negative labels, shape = [n]
+        num_segs: Number of target segments
+        num_labels: Number of distinct labels
+    Returns:
+        Int32 ndarray of label counts of shape [num_segs, num_labels] and
+        Int64 ndarray of first input positions of shape [num_segs, num_labels] (n where a label never appears)
+    """
+    n = mapping.shape[0]
+    counts = np.zeros((num_segs, num_labels), dtype=np.int32)
+    first_pos = np.full((num_segs, num_labels), n, dtype=np.int64)
+    for i in range(n):
+        if counts[mapping[i], labels[i]] == 0:
+            first_pos[mapping[i], labels[i]] = i
+        counts[mapping[i], labels[i]] += 1
+    return counts, first_pos
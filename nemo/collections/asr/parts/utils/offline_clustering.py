@@ -37,6 +37,21 @@ import torch
 from torch.linalg import eigh, eigvalsh
 
 
+def l2_normalize(emb: torch.Tensor, eps=torch.tensor(3.5e-4)) -> torch.Tensor:
+    """
+    Divide each feature vector by its L2 norm so that cosine similarities reduce to inner products.
+
+    Args:
+        emb (Tensor):
+            Matrix containing speaker representation vectors. (N x embedding_dim)
+
+    Returns:
+        emb_norm (Tensor):
+            Matrix containing L2-normalized speaker representation vectors. (N x embedding_dim)
+    """
+    return emb / (torch.norm(emb, dim=1).unsqueeze(1) + eps)
+
+
 def cos_similarity(emb_a: torch.Tensor, emb_b: torch.Tensor, eps=torch.tensor(3.5e-4)) -> torch.Tensor:
     """
     Calculate cosine similarities of the given two set of tensors. The output is an N by N
@@ -55,8 +70,8 @@ def cos_similarity(emb_a: torch.Tensor, emb_b: torch.Tensor, eps=torch.tensor(3.
     # If number of embedding count is 1, it creates nan values
     if emb_a.shape[0] == 1 or emb_b.shape[0] == 1:
         raise ValueError(f"Number of feature vectors should be greater than 1 but got {emb_a.shape} and {emb_b.shape}")
-    a_norm = emb_a / (torch.norm(emb_a, dim=1).unsqueeze(1) + eps)
-    b_norm = emb_b / (torch.norm(emb_b, dim=1).unsqueeze(1) + eps)
+    a_norm = l2_normalize(emb_a, eps=eps)
+    b_norm = l2_normalize(emb_b, eps=eps)
     res = torch.mm(a_norm, b_norm.transpose(0, 1))
     res.fill_diagonal_(1)
     return res
@@ -323,12 +338,11 @@ def getKneighborsConnections(affinity_mat: torch.Tensor, p_value: int, mask_meth
             A binarized affinity matrix based on the given mask method.
     """
     dim = affinity_mat.shape
+    p_value = min(p_value, dim[1])
     binarized_affinity_mat = torch.zeros_like(affinity_mat).half()
-    sorted_matrix = torch.argsort(affinity_mat, dim=1, descending=True)[:, :p_value]
-    binarized_affinity_mat[sorted_matrix.T, torch.arange(affinity_mat.shape[0])] = (
-        torch.ones(1).to(affinity_mat.device).half()
-    )
-    indices_row = sorted_matrix[:, :p_value].flatten()
+    # Partial selection of the top-p entries avoids sorting every row of the N x N matrix.
+    topk_matrix = torch.topk(affinity_mat, k=p_value, dim=1, sorted=False)[1]
+    indices_row = topk_matrix.flatten()
     indices_col = torch.arange(dim[1]).repeat(p_value, 1).T.flatten()
     if mask_method == 'binary' or mask_method is None:
         binarized_affinity_mat[indices_row, indices_col] = (
@@ -414,7 +428,7 @@ def get_argmin_mat(timestamps_in_scales: List[torch.Tensor]) -> List[torch.Tenso
     return session_scale_mapping_list
 
 
-def getCosAffinityMatrix(emb: torch.Tensor) -> torch.Tensor:
+def getCosAffinityMatrix(emb: torch.Tensor, fp16_affinity: bool = False) -> torch.Tensor:
     """
     Calculate cosine similarity values among speaker embeddings then min-max normalize
     the affinity matrix.
@@ -424,6 +438,9 @@ def getCosAffinityMatrix(emb: torch.Tensor) -> torch.Tensor:
             Matrix containing embedding vectors. emb variable should be float(FP32) type to make the data-type
             compatible with torch.mm operation for both CPU and GPU(CUDA).
             dimension: (Number of embedding vectors) x (embedding dimension)
+        fp16_affinity (bool):
+            If True and `emb` is on a CUDA device, the normalized embeddings are multiplied in FP16 on tensor cores.
+            The resulting affinity matrix is returned in FP32.
 
     Returns:
         sim_d (Tensor):
@@ -433,8 +450,14 @@ def getCosAffinityMatrix(emb: torch.Tensor) -> torch.Tensor:
     if emb.shape[0] == 1:
         sim_d = torch.tensor([[1]]).to(emb.device)
     else:
-        emb = emb.float()
-        sim_d = cos_similarity(emb, emb)
+        # Normalize the embeddings only once since the affinity is the inner product of the matrix with itself.
+        emb_norm = l2_normalize(emb.float())
+        if fp16_affinity and emb_norm.is_cuda:
+            emb_norm = emb_norm.half()
+            sim_d = torch.mm(emb_norm, emb_norm.t()).float()
+        else:
+            sim_d = torch.mm(emb_norm, emb_norm.t())
+        sim_d.fill_diagonal_(1)
         sim_d = ScalerMinMax(sim_d)
     return sim_d
 
@@ -492,11 +515,15 @@ def getMultiScaleCosAffinityMatrix(
     embeddings_in_scales: List[torch.Tensor],
     timestamps_in_scales: List[torch.Tensor],
     device: torch.device = torch.device('cpu'),
+    block_size: int = 4096,
+    fp16_affinity: bool = False,
 ) -> torch.Tensor:
     """
     Calculate cosine similarity values among speaker embeddings for each scale then
     apply multiscale weights to calculate the fused similarity matrix.
     NOTE: Due to CUDA memory limit, the embedding vectors in embeddings_in_scales are stored in `cpu` device.
+    The affinity matrix of each scale is expanded to the base scale in blocks of `block_size` rows, so that
+    no full-size intermediate matrices other than `fused_sim_d` are allocated on `device`.
 
     Args:
         multiscale_weights (Tensor):
@@ -508,6 +535,10 @@ def getMultiScaleCosAffinityMatrix(
             List containing split timestamps tensors by each scale
         device (torch.device):
             Torch device variable
+        block_size (int):
+            Number of base-scale rows of the fused affinity matrix that are updated at once
+        fp16_affinity (bool):
+            If True, the affinity matrix of each scale is calculated in FP16 when running on CUDA
 
     Returns:
         fused_sim_d (Tensor):
@@ -518,14 +549,17 @@ def getMultiScaleCosAffinityMatrix(
     session_scale_mapping_list = get_argmin_mat(timestamps_in_scales)
     scale_list = list(range(len(timestamps_in_scales)))
     fused_sim_d = torch.zeros(len(timestamps_in_scales[-1]), len(timestamps_in_scales[-1])).to(device)
+    base_seg_count = fused_sim_d.shape[0]
     for scale_idx in scale_list:
-        mapping_argmat = session_scale_mapping_list[scale_idx]
+        mapping_argmat = session_scale_mapping_list[scale_idx].to(device)
         emb_t = embeddings_in_scales[scale_idx].half().to(device)
-        score_mat_torch = getCosAffinityMatrix(emb_t)
-        repeat_list = getRepeatedList(mapping_argmat, torch.tensor(score_mat_torch.shape[0])).to(device)
-        repeated_tensor_0 = torch.repeat_interleave(score_mat_torch, repeats=repeat_list, dim=0).to(device)
-        repeated_tensor_1 = torch.repeat_interleave(repeated_tensor_0, repeats=repeat_list, dim=1).to(device)
-        fused_sim_d += multiscale_weights[scale_idx] * repeated_tensor_1
+        score_mat_torch = getCosAffinityMatrix(emb_t, fp16_affinity=fp16_affinity)
+        # `mapping_argmat` is sorted, so indexing with it is equivalent to repeating rows and columns
+        # by segment counts.
+        for stt in range(0, base_seg_count, block_size):
+            end = min(stt + block_size, base_seg_count)
+            repeated_block = score_mat_torch[mapping_argmat[stt:end]][:, mapping_argmat]
+            fused_sim_d[stt:end] += multiscale_weights[scale_idx] * repeated_block
     return fused_sim_d
 
 
@@ -1130,6 +1164,7 @@ class SpeakerClustering(torch.nn.Module):
         maj_vote_spk_count: bool = False,
         parallelism: bool = False,
         cuda: bool = False,
+        fp16_affinity: bool = False,
     ):
         """
         Clustering method for speaker diarization based on cosine similarity.
@@ -1152,6 +1187,9 @@ class SpeakerClustering(torch.nn.Module):
                 Use dynamic parallelism feature in torch.jit compiler to accelerate the p-value search.
             cuda (bool):
                 Boolean variable for toggling cuda availability.
+            fp16_affinity (bool):
+                If True, calculate the cosine affinity matrices in FP16 when `cuda` is True.
+                Eigen decomposition and NME analysis still run in FP32.
         """
         super().__init__()
         self.min_samples_for_nmesc: int = min_samples_for_nmesc
@@ -1159,6 +1197,7 @@ class SpeakerClustering(torch.nn.Module):
         self.sparse_search: bool = sparse_search
         self.parallelism: bool = parallelism
         self.cuda: bool = cuda
+        self.fp16_affinity: bool = fp16_affinity
         self.maj_vote_spk_count: bool = maj_vote_spk_count
         self.embeddings_in_scales: List[torch.Tensor] = [torch.Tensor(0)]
         self.timestamps_in_scales: List[torch.Tensor] = [torch.Tensor(0)]
@@ -1373,6 +1412,7 @@ class SpeakerClustering(torch.nn.Module):
             embeddings_in_scales=self.embeddings_in_scales,
             timestamps_in_scales=self.timestamps_in_scales,
             device=self.device,
+            fp16_affinity=self.fp16_affinity,
         )
 
         return self.forward_unit_infer(
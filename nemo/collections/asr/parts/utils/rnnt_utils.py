@@ -212,9 +212,12 @@ def select_k_expansions(
         k_expansions: Best K expansion hypotheses candidates.
     """
     k_expansions = []
+    # read the candidates to host once, instead of synchronizing for each element
+    topk_idxs_list = topk_idxs.tolist()
+    topk_logps_list = topk_logps.tolist()
 
     for i, hyp in enumerate(hyps):
-        hyp_i = [(int(k), hyp.score + float(v)) for k, v in zip(topk_idxs[i], topk_logps[i])]
+        hyp_i = [(k, hyp.score + v) for k, v in zip(topk_idxs_list[i], topk_logps_list[i])]
         k_best_exp_val = max(hyp_i, key=lambda x: x[1])
 
         k_best_exp_idx = k_best_exp_val[0]
@@ -233,6 +236,20 @@ def select_k_expansions(
     return k_expansions
 
 
+def _double_storage(tensor: torch.Tensor, dim: int) -> torch.Tensor:
+    """
+    Allocate a tensor twice the size of `tensor` along `dim`, with `tensor` copied to the first half
+    and zeros in the second half. Unlike `torch.cat` with `torch.zeros_like`, no temporary tensor is allocated.
+    """
+    size = tensor.shape[dim]
+    new_shape = list(tensor.shape)
+    new_shape[dim] = size * 2
+    new_tensor = tensor.new_empty(new_shape)
+    new_tensor.narrow(dim, 0, size).copy_(tensor)
+    new_tensor.narrow(dim, size, size).zero_()
+    return new_tensor
+
+
 class BatchedHyps:
     """Class to store batched hypotheses (labels, time_indices, scores) for efficient RNNT decoding"""
 
@@ -257,6 +274,9 @@ class BatchedHyps:
         if batch_size <= 0:
             raise ValueError(f"batch_size must be > 0, got {batch_size}")
         self._max_length = init_length
+        # upper bound for the maximum of `current_lengths`, tracked on the host to avoid synchronization
+        # when checking if the storage should be increased
+        self._max_current_length = 0
 
         # batch of current lengths of hypotheses and correspoinding timesteps
         self.current_lengths = torch.zeros(batch_size, device=device, dtype=torch.long)
@@ -275,16 +295,15 @@ class BatchedHyps:
         # number of labels for the last timestep
         self.last_timestep_lasts = torch.zeros(batch_size, device=device, dtype=torch.long)
         self._batch_indices = torch.arange(batch_size, device=device)
-        self._ones_batch = torch.ones_like(self._batch_indices)
 
     def clear_(self):
         """
         Clears batched hypotheses state.
+        Storage beyond `current_lengths` is never read, so only lengths and per-hypothesis state are reset,
+        and the preallocated storage can be reused without filling it.
         """
         self.current_lengths.fill_(0)
-        self.transcript.fill_(0)
-        self.timesteps.fill_(0)
-        self.token_durations.fill_(0)
+        self._max_current_length = 0
         self.scores.fill_(0.0)
         self.last_timestep.fill_(-1)
         self.last_timestep_lasts.fill_(0)
@@ -294,11 +313,22 @@ class BatchedHyps:
         Allocate 2x space for tensors, similar to common C++ std::vector implementations
         to maintain O(1) insertion time complexity
         """
-        self.transcript = torch.cat((self.transcript, torch.zeros_like(self.transcript)), dim=-1)
-        self.timesteps = torch.cat((self.timesteps, torch.zeros_like(self.timesteps)), dim=-1)
-        self.token_durations = torch.cat((self.token_durations, torch.zeros_like(self.token_durations)), dim=-1)
+        self.transcript = _double_storage(self.transcript, dim=-1)
+        self.timesteps = _double_storage(self.timesteps, dim=-1)
+        self.token_durations = _double_storage(self.token_durations, dim=-1)
         self._max_length *= 2
 
+    def _maybe_allocate_more(self):
+        """
+        Increase storage if the next result may not fit into it.
+        The actual lengths are read from the device (which requires synchronization)
+        only when the upper bound tracked on the host reaches the storage size.
+        """
+        if self._max_current_length + 1 >= self._max_length:
+            self._max_current_length = int(self.current_lengths.max().item())
+            if self._max_current_length + 1 >= self._max_length:
+                self._allocate_more()
+
     def add_results_(
         self,
         active_indices: torch.Tensor,
@@ -319,8 +349,7 @@ class BatchedHyps:
         if active_indices.shape[0] == 0:
             return  # nothing to add
         # if needed - increase storage
-        if self.current_lengths.max().item() >= self._max_length:
-            self._allocate_more()
+        self._maybe_allocate_more()
 
         self.add_results_no_checks_(
             active_indices=active_indices,
@@ -366,6 +395,7 @@ class BatchedHyps:
         self.last_timestep[active_indices] = time_indices
         # increase lengths
         self.current_lengths[active_indices] += 1
+        self._max_current_length += 1
 
     def add_results_masked_(
         self,
@@ -384,8 +414,7 @@ class BatchedHyps:
             time_indices: tensor of time index for each label
             scores: label scores
         """
-        if (self.current_lengths + active_mask).max() >= self._max_length:
-            self._allocate_more()
+        self._maybe_allocate_more()
         self.add_results_masked_no_checks_(
             active_mask=active_mask,
             labels=labels,
@@ -424,15 +453,10 @@ class BatchedHyps:
             self.token_durations[self._batch_indices, self.current_lengths] = token_durations
         # store last observed timestep + number of observation for the current timestep
         # if last_timestep == time_indices, increase; else set to 1
+        # (last_timestep_lasts * same_timestep + 1) covers both cases, the timestep comparison is computed once
         torch.where(
-            torch.logical_and(active_mask, self.last_timestep == time_indices),
-            self.last_timestep_lasts + 1,
-            self.last_timestep_lasts,
-            out=self.last_timestep_lasts,
-        )
-        torch.where(
-            torch.logical_and(active_mask, self.last_timestep != time_indices),
-            self._ones_batch,
+            active_mask,
+            self.last_timestep_lasts * (self.last_timestep == time_indices) + 1,
             self.last_timestep_lasts,
             out=self.last_timestep_lasts,
         )
@@ -440,6 +464,7 @@ class BatchedHyps:
         torch.where(active_mask, time_indices, self.last_timestep, out=self.last_timestep)
         # increase lengths
         self.current_lengths += active_mask
+        self._max_current_length += 1
 
 
 class BatchedAlignments:
@@ -478,6 +503,9 @@ class BatchedAlignments:
         self.with_duration_confidence = with_duration_confidence
         self.with_alignments = store_alignments
         self._max_length = init_length
+        # upper bound for the maximum of `current_lengths`, tracked on the host to avoid synchronization
+        # when checking if the storage should be increased
+        self._max_current_length = 0
 
         # tensor to store observed timesteps (for alignments / confidence scores)
         self.timesteps = torch.zeros((batch_size, self._max_length), device=device, dtype=torch.long)
@@ -506,26 +534,36 @@ class BatchedAlignments:
     def clear_(self):
         """
         Clears batched hypotheses state.
+        Storage beyond `current_lengths` is never read, so only lengths are reset,
+        and the preallocated storage (including logits) can be reused without filling it.
         """
         self.current_lengths.fill_(0)
-        self.timesteps.fill_(0)
-        self.logits.fill_(0.0)
-        self.labels.fill_(0)
-        self.frame_confidence.fill_(0)
+        self._max_current_length = 0
 
     def _allocate_more(self):
         """
         Allocate 2x space for tensors, similar to common C++ std::vector implementations
         to maintain O(1) insertion time complexity
         """
-        self.timesteps = torch.cat((self.timesteps, torch.zeros_like(self.timesteps)), dim=-1)
+        self.timesteps = _double_storage(self.timesteps, dim=-1)
         if self.with_alignments:
-            self.logits = torch.cat((self.logits, torch.zeros_like(self.logits)), dim=1)
-            self.labels = torch.cat((self.labels, torch.zeros_like(self.labels)), dim=-1)
+            self.logits = _double_storage(self.logits, dim=1)
+            self.labels = _double_storage(self.labels, dim=-1)
         if self.with_frame_confidence:
-            self.frame_confidence = torch.cat((self.frame_confidence, torch.zeros_like(self.frame_confidence)), dim=1)
+            self.frame_confidence = _double_storage(self.frame_confidence, dim=1)
         self._max_length *= 2
 
+    def _maybe_allocate_more(self):
+        """
+        Increase storage if the next result may not fit into it.
+        The actual lengths are read from the device (which requires synchronization)
+        only when the upper bound tracked on the host reaches the storage size.
+        """
+        if self._max_current_length + 1 >= self._max_length:
+            self._max_current_length = int(self.current_lengths.max().item())
+            if self._max_current_length + 1 >= self._max_length:
+                self._allocate_more()
+
     def add_results_(
         self,
         active_indices: torch.Tensor,
@@ -549,8 +587,7 @@ class BatchedAlignments:
             return  # nothing to add
 
         # if needed - increase storage
-        if self.current_lengths.max().item() >= self._max_length:
-            self._allocate_more()
+        self._maybe_allocate_more()
 
         active_lengths = self.current_lengths[active_indices]
         # store timesteps - same for alignments / confidence
@@ -564,6 +601,7 @@ class BatchedAlignments:
             self.frame_confidence[active_indices, active_lengths] = confidence
         # increase lengths
         self.current_lengths[active_indices] += 1
+        self._max_current_length += 1
 
     def add_results_masked_(
         self,
@@ -583,8 +621,7 @@ class BatchedAlignments:
             labels: tensor with decoded labels (can contain blank)
             confidence: optional tensor with confidence for each item in batch
         """
-        if (self.current_lengths + active_mask).max() >= self._max_length:
-            self._allocate_more()
+        self._maybe_allocate_more()
         self.add_results_masked_no_checks_(
             active_mask=active_mask, time_indices=time_indices, logits=logits, labels=labels, confidence=confidence
         )
@@ -613,7 +650,6 @@ class BatchedAlignments:
         self.timesteps[self._batch_indices, self.current_lengths] = time_indices
 
         if self.with_alignments and logits is not None and labels is not None:
-            self.timesteps[self._batch_indices, self.current_lengths] = time_indices
             self.logits[self._batch_indices, self.current_lengths] = logits
             self.labels[self._batch_indices, self.current_lengths] = labels
 
@@ -621,6 +657,7 @@ class BatchedAlignments:
             self.frame_confidence[self._batch_indices, self.current_lengths] = confidence
         # increase lengths
         self.current_lengths += active_mask
+        self._max_current_length += 1
 
 
 def batched_hyps_to_hypotheses(
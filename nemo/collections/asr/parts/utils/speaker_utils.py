@@ -13,12 +13,17 @@
 # limitations under the License.
 
 import gc
+import io
 import json
 import math
+import mmap
 import os
+import pickle
 import shutil
 from copy import deepcopy
-from typing import Dict, List, Tuple, Union
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Set, Tuple, Union
 
 import numpy as np
 import omegaconf
@@ -32,6 +37,13 @@ from nemo.collections.asr.parts.utils.longform_clustering import LongFormSpeaker
 from nemo.collections.asr.parts.utils.offline_clustering import SpeakerClustering, get_argmin_mat, split_input_data
 from nemo.utils import logging
 
+try:
+    from nemo.collections.asr.parts.utils import numba_utils
+
+    HAVE_NUMBA = True
+except (ImportError, ModuleNotFoundError):
+    HAVE_NUMBA = False
+
 """
 This file contains all the utility functions required for speaker embeddings part in diarization scripts
 """
@@ -89,9 +101,7 @@ def audio_rttm_map(manifest, attach_dur=False):
 
     AUDIO_RTTM_MAP = {}
     with open(manifest, 'r') as inp_file:
-        lines = inp_file.readlines()
-        logging.info("Number of files to diarize: {}".format(len(lines)))
-        for line in lines:
+        for line in inp_file:
             line = line.strip()
             dic = json.loads(line)
 
@@ -118,10 +128,38 @@ def audio_rttm_map(manifest, attach_dur=False):
                         meta['audio_filepath']
                     )
                 )
-
+    logging.info("Number of files to diarize: {}".format(len(AUDIO_RTTM_MAP)))
     return AUDIO_RTTM_MAP
 
 
+def get_existing_filepaths(filepaths: Iterable[str]) -> Set[str]:
+    """
+    Return the subset of `filepaths` that exist. Each parent directory is listed once with `os.scandir`, so that
+    checking the RTTM files of a large manifest does not issue a `stat` call per file.
+
+    Args:
+        filepaths (Iterable[str]):
+            Paths of the files to be checked.
+
+    Returns:
+        existing_filepaths (set):
+            Set of the paths in `filepaths` that exist.
+    """
+    filepaths_per_dir = {}
+    for filepath in filepaths:
+        filepaths_per_dir.setdefault(os.path.dirname(filepath) or os.curdir, []).append(filepath)
+
+    existing_filepaths = set()
+    for dirpath, dir_filepaths in filepaths_per_dir.items():
+        try:
+            with os.scandir(dirpath) as entries:
+                entry_names = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        existing_filepaths.update(path for path in dir_filepaths if os.path.basename(path) in entry_names)
+    return existing_filepaths
+
+
 def parse_scale_configs(window_lengths_in_sec, shift_lengths_in_sec, multiscale_weights):
     """
     Check whether multiscale parameters are provided correctly. window_lengths_in_sec, shift_lengfhs_in_sec and
@@ -464,12 +502,17 @@ def perform_clustering(
         logging.warning("cuda=False, using CPU for eigen decomposition. This might slow down the clustering process.")
         cuda = False
 
-    speaker_clustering = LongFormSpeakerClustering(cuda=cuda)
+    speaker_clustering = LongFormSpeakerClustering(
+        cuda=cuda, fp16_affinity=clustering_params.get('fp16_affinity', False)
+    )
 
     if clustering_params.get('export_script_module', False):
         speaker_clustering = torch.jit.script(speaker_clustering)
         torch.jit.save(speaker_clustering, 'speaker_clustering_script.pt')
 
+    existing_rttm_files = get_existing_filepaths(
+        value['rttm_filepath'] for value in AUDIO_RTTM_MAP.values() if value.get('rttm_filepath', None) is not None
+    )
     for uniq_id, audio_rttm_values in tqdm(AUDIO_RTTM_MAP.items(), desc='clustering', leave=True, disable=not verbose):
         uniq_embs_and_timestamps = embs_and_timestamps[uniq_id]
 
@@ -515,7 +558,7 @@ def perform_clustering(
         all_hypothesis.append([uniq_id, hypothesis])
 
         rttm_file = audio_rttm_values.get('rttm_filepath', None)
-        if rttm_file is not None and os.path.exists(rttm_file) and not no_references:
+        if not no_references and rttm_file in existing_rttm_files:
             ref_labels = rttm_to_labels(rttm_file)
             reference = labels_to_pyannote_object(ref_labels, uniq_name=uniq_id)
             all_reference.append([uniq_id, reference])
@@ -593,8 +636,7 @@ def write_overlap_segments(outfile, AUDIO_RTTM_MAP, uniq_id, overlap_range_list,
             "label": 'UNK',
             "uniq_id": uniq_id,
         }
-        json.dump(meta, outfile)
-        outfile.write("\n")
+        outfile.write(json.dumps(meta) + "\n")
 
 
 def read_rttm_lines(rttm_file_path):
@@ -901,8 +943,7 @@ def segments_manifest_to_subsegments_manifest(
     with open(segments_manifest_file, 'r') as segments_manifest, open(
         subsegments_manifest_file, 'w'
     ) as subsegments_manifest:
-        segments = segments_manifest.readlines()
-        for segment in segments:
+        for segment in segments_manifest:
             segment = segment.strip()
             dic = json.loads(segment)
             audio, offset, duration, label = dic['audio_filepath'], dic['offset'], dic['duration'], dic['label']
@@ -921,9 +962,8 @@ def segments_manifest_to_subsegments_manifest(
                         "label": label,
                         "uniq_id": uniq_id,
                     }
-
-                    json.dump(meta, subsegments_manifest)
-                    subsegments_manifest.write("\n")
+                    # `json.dumps` uses the C encoder, while `json.dump` falls back to the pure-Python one.
+                    subsegments_manifest.write(json.dumps(meta) + "\n")
 
     return subsegments_manifest_file
 
@@ -1275,6 +1315,49 @@ def get_scale_mapping_argmat(uniq_embs_and_timestamps: Dict[str, dict]) -> Dict[
     return scale_mapping_argmat
 
 
+def get_majority_mapped_labels(scale_mapping: np.ndarray, labels: np.ndarray, num_segs: int) -> np.ndarray:
+    """
+    Assign each target segment the most frequent label among the base-scale segments mapped to it.
+    Ties go to the label that appears first in the segment, as with `statistics.mode`.
+    Segments without any mapped base-scale segment inherit the label of the preceding segment,
+    and leading empty segments get label 0.
+
+    Args:
+        scale_mapping (np.ndarray):
+            Integer array of target segment indices for each base-scale segment, shape = [num_base_segs]
+        labels (np.ndarray):
+            Integer array of base-scale labels, shape = [num_base_segs]. Negative labels are allowed.
+        num_segs (int):
+            Number of target segments.
+
+    Returns:
+        new_labels (np.ndarray):
+            Int64 array of labels for the target segments, shape = [num_segs]
+    """
+    scale_mapping = np.asarray(scale_mapping, dtype=np.int64)
+    labels = np.asarray(labels, dtype=np.int64)
+    num_base_segs = labels.shape[0]
+    if num_base_segs == 0:
+        return np.zeros(num_segs, dtype=np.int64)
+    label_offset = min(int(labels.min()), 0)
+    label_index = labels - label_offset
+    num_labels = int(label_index.max()) + 1
+    if HAVE_NUMBA:
+        label_counts, first_pos = numba_utils.count_mapped_labels(scale_mapping, label_index, num_segs, num_labels)
+    else:
+        label_counts = np.zeros((num_segs, num_labels), dtype=np.int32)
+        np.add.at(label_counts, (scale_mapping, label_index), 1)
+        first_pos = np.full((num_segs, num_labels), num_base_segs, dtype=np.int64)
+        np.minimum.at(first_pos, (scale_mapping, label_index), np.arange(num_base_segs))
+    new_labels = (label_counts.astype(np.int64) * (num_base_segs + 1) - first_pos).argmax(axis=1) + label_offset
+
+    empty_segs = label_counts.sum(axis=1) == 0
+    if empty_segs.any():
+        last_filled = np.maximum.accumulate(np.where(empty_segs, -1, np.arange(num_segs)))
+        new_labels = np.where(last_filled >= 0, new_labels[np.maximum(last_filled, 0)], 0)
+    return new_labels
+
+
 def get_overlap_stamps(cont_stamps: List[str], ovl_spk_idx: List[str]):
     """
     Generate timestamps that include overlap speech. Overlap-including timestamps are created based on the segments that are
@@ -1399,15 +1482,30 @@ def generate_speaker_timestamps(
 
 def get_uniq_id_list_from_manifest(manifest_file: str):
     """Retrieve `uniq_id` values from the given manifest_file and save the IDs to a list.
+    Parsed IDs are cached per manifest file path and modification time.
+    """
+    manifest_stat = os.stat(manifest_file)
+    uniq_id_tuple = _read_uniq_ids_from_manifest(
+        os.path.abspath(manifest_file), manifest_stat.st_mtime_ns, manifest_stat.st_size
+    )
+    return list(uniq_id_tuple)
+
+
+@lru_cache(maxsize=16)
+def _read_uniq_ids_from_manifest(manifest_file: str, mtime_ns: int, file_size: int) -> Tuple[str, ...]:
+    """Parse `uniq_id` values from the manifest file in a single streaming pass.
+    Blocks of manifest lines are decoded with a single `json.loads` call each to amortize the per-call overhead.
+    `mtime_ns` and `file_size` are only used as cache keys to invalidate the cache when the file changes.
     """
     uniq_id_list = []
     with open(manifest_file, 'r', encoding='utf-8') as manifest:
-        for i, line in enumerate(manifest.readlines()):
-            line = line.strip()
-            dic = json.loads(line)
-            uniq_id = get_uniqname_from_filepath(dic['audio_filepath'])
-            uniq_id_list.append(uniq_id)
-    return uniq_id_list
+        while True:
+            lines = list(islice(manifest, 4096))
+            if not lines:
+                break
+            entries = json.loads('[' + ','.join(line for line in lines if line.strip()) + ']')
+            uniq_id_list.extend(get_uniqname_from_filepath(entry['audio_filepath']) for entry in entries)
+    return tuple(uniq_id_list)
 
 
 def get_id_tup_dict(uniq_id_list: List[str], test_data_collection, preds_list: List[torch.Tensor]):
@@ -1507,18 +1605,107 @@ def extract_timestamps(manifest_file: str):
     logging.info(f"Extracting timestamps from {manifest_file} for multiscale subsegmentation.")
     time_stamps = {}
     with open(manifest_file, 'r', encoding='utf-8') as manifest:
-        for i, line in enumerate(manifest.readlines()):
-            line = line.strip()
+        for line in manifest:
             dic = json.loads(line)
-            uniq_name = dic['uniq_id']
-            if uniq_name not in time_stamps:
-                time_stamps[uniq_name] = []
             start = dic['offset']
             end = start + dic['duration']
-            time_stamps[uniq_name].append([start, end])
+            time_stamps.setdefault(dic['uniq_id'], []).append([start, end])
     return time_stamps
 
 
+class _OutOfBandTensorPickler(pickle.Pickler):
+    """
+    Pickler that serializes CPU tensors through NumPy arrays so that their data is handed to `buffer_callback`
+    as out-of-band `PickleBuffer` objects (PEP 574) instead of being copied into the pickle stream.
+    """
+
+    def reducer_override(self, obj):
+        if (
+            type(obj) is torch.Tensor
+            and obj.device.type == 'cpu'
+            and not obj.requires_grad
+            and obj.dtype != torch.bfloat16
+        ):
+            return torch.from_numpy, (obj.numpy(),)
+        return NotImplemented
+
+
+# Alignment of out-of-band buffers in files written by `save_pickle_with_buffers`, same as the `.npy` data alignment.
+_PICKLE_BUFFER_ALIGNMENT = 64
+
+
+def save_pickle_with_buffers(obj: Any, filepath: str):
+    """
+    Pickle `obj` with protocol 5 and write the tensor and array data as raw out-of-band buffers after the pickle
+    stream, so that the data is neither copied into the pickle stream on save nor out of it on load. Each buffer
+    starts at a file offset aligned to 64 bytes, so that memory-mapped views are aligned for any dtype. The buffer
+    offsets, relative to the first aligned offset after the pickle stream, are recorded in the header.
+
+    Args:
+        obj (Any):
+            Object to be saved. CPU tensors and NumPy arrays in `obj` are saved as out-of-band buffers.
+        filepath (str):
+            Path of the output file.
+    """
+    buffers = []
+    with io.BytesIO() as stream:
+        _OutOfBandTensorPickler(stream, protocol=5, buffer_callback=buffers.append).dump(obj)
+        payload = stream.getvalue()
+    raw_buffers = [buffer.raw() for buffer in buffers]
+    buffer_offsets, buffer_end = [], 0
+    for raw in raw_buffers:
+        buffer_offsets.append(buffer_end)
+        buffer_end += raw.nbytes + (-raw.nbytes % _PICKLE_BUFFER_ALIGNMENT)
+    header = {
+        'payload_size': len(payload),
+        'alignment': _PICKLE_BUFFER_ALIGNMENT,
+        'buffer_offsets': buffer_offsets,
+        'buffer_sizes': [raw.nbytes for raw in raw_buffers],
+    }
+    with open(filepath, 'wb') as f:
+        pickle.dump(header, f, protocol=5)
+        f.write(payload)
+        f.write(bytes(-f.tell() % _PICKLE_BUFFER_ALIGNMENT))
+        buffers_start = f.tell()
+        for buffer_offset, raw in zip(buffer_offsets, raw_buffers):
+            f.write(bytes(buffers_start + buffer_offset - f.tell()))
+            f.write(raw)
+
+
+def load_pickle_with_buffers(filepath: str) -> Any:
+    """
+    Load an object saved by `save_pickle_with_buffers`. The file is memory-mapped and each out-of-band buffer is
+    handed to the unpickler as an aligned view of the mapping, so the restored tensors and arrays use the mapped
+    pages directly instead of a copy read into user space. Pages are only read from disk when they are accessed. The
+    mapping is private (copy-on-write), so the restored tensors stay writable without modifying the file, and it
+    remains valid after the file is replaced or removed.
+
+    Args:
+        filepath (str):
+            Path of the file saved by `save_pickle_with_buffers`.
+
+    Returns:
+        obj (Any):
+            Restored object.
+    """
+    with open(filepath, 'rb') as f:
+        header = pickle.load(f)
+        payload_start = f.tell()
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mm)
+    payload_end = payload_start + header['payload_size']
+    buffers_start = payload_end + (-payload_end % header['alignment'])
+    buffer_ranges = [
+        (buffers_start + buffer_offset, buffers_start + buffer_offset + buffer_size)
+        for buffer_offset, buffer_size in zip(header['buffer_offsets'], header['buffer_sizes'])
+    ]
+    if any(buffer_end > len(view) for _, buffer_end in buffer_ranges):
+        raise EOFError(f"Unexpected end of file while reading out-of-band buffers from {filepath}")
+    buffers = [view[buffer_start:buffer_end] for buffer_start, buffer_end in buffer_ranges]
+    # The views in `buffers` keep the mapping alive for as long as the restored object uses them.
+    return pickle.loads(view[payload_start : payload_start + header['payload_size']], buffers=buffers)
+
+
 def make_rttm_with_overlap(
     manifest_file_path: str,
     clus_label_dict: Dict[str, List[Union[float, int]]],
@@ -1553,30 +1740,31 @@ def make_rttm_with_overlap(
     manifest_file_lengths_list = []
     all_hypothesis, all_reference = [], []
     no_references = False
-    with open(manifest_file_path, 'r', encoding='utf-8') as manifest:
-        for i, line in enumerate(manifest.readlines()):
-            uniq_id = get_uniq_id_from_manifest_line(line)
-            manifest_dic = AUDIO_RTTM_MAP[uniq_id]
-            clus_labels = clus_label_dict[uniq_id]
-            manifest_file_lengths_list.append(len(clus_labels))
-            maj_labels, ovl_labels = generate_speaker_timestamps(clus_labels, msdd_preds[i], **params)
-            if params['infer_overlap']:
-                hyp_labels = maj_labels + ovl_labels
-            else:
-                hyp_labels = maj_labels
-            hypothesis = labels_to_pyannote_object(hyp_labels, uniq_name=uniq_id)
-            if params['out_rttm_dir']:
-                hyp_labels = sorted(hyp_labels, key=lambda x: float(x.split()[0]))
-                labels_to_rttmfile(hyp_labels, uniq_id, params['out_rttm_dir'])
-            all_hypothesis.append([uniq_id, hypothesis])
-            rttm_file = manifest_dic.get('rttm_filepath', None)
-            if rttm_file is not None and os.path.exists(rttm_file) and not no_references:
-                ref_labels = rttm_to_labels(rttm_file)
-                reference = labels_to_pyannote_object(ref_labels, uniq_name=uniq_id)
-                all_reference.append([uniq_id, reference])
-            else:
-                no_references = True
-                all_reference = []
+    existing_rttm_files = get_existing_filepaths(
+        value['rttm_filepath'] for value in AUDIO_RTTM_MAP.values() if value.get('rttm_filepath', None) is not None
+    )
+    # AUDIO_RTTM_MAP preserves the order of the manifest lines, so the manifest does not need to be parsed again.
+    for i, (uniq_id, manifest_dic) in enumerate(AUDIO_RTTM_MAP.items()):
+        clus_labels = clus_label_dict[uniq_id]
+        manifest_file_lengths_list.append(len(clus_labels))
+        maj_labels, ovl_labels = generate_speaker_timestamps(clus_labels, msdd_preds[i], **params)
+        if params['infer_overlap']:
+            hyp_labels = maj_labels + ovl_labels
+        else:
+            hyp_labels = maj_labels
+        hypothesis = labels_to_pyannote_object(hyp_labels, uniq_name=uniq_id)
+        if params['out_rttm_dir']:
+            hyp_labels = sorted(hyp_labels, key=lambda x: float(x.split()[0]))
+            labels_to_rttmfile(hyp_labels, uniq_id, params['out_rttm_dir'])
+        all_hypothesis.append([uniq_id, hypothesis])
+        rttm_file = manifest_dic.get('rttm_filepath', None)
+        if not no_references and rttm_file in existing_rttm_files:
+            ref_labels = rttm_to_labels(rttm_file)
+            reference = labels_to_pyannote_object(ref_labels, uniq_name=uniq_id)
+            all_reference.append([uniq_id, reference])
+        else:
+            no_references = True
+            all_reference = []
     return all_reference, all_hypothesis
 
 
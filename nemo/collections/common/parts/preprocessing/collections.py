@@ -15,6 +15,7 @@
 import collections
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from itertools import combinations
 from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
@@ -1253,13 +1254,20 @@ class DiarizationSpeechLabel(DiarizationLabel):
             [],
         )
 
-        for item in manifest.item_iter(manifests_files, parse_func=self.__parse_item_rttm):
+        items = list(manifest.item_iter(manifests_files, parse_func=self.__parse_item_rttm))
+        if not self.pairwise_infer:
+            # Reading the RTTM files is I/O bound, so overlap the reads of all sessions with a thread pool.
+            with ThreadPoolExecutor() as executor:
+                rttm_files_list = [item['rttm_file'] for item in items]
+                rttm_speaker_sets = list(executor.map(self.get_rttm_speaker_set, rttm_files_list))
+
+        for item_index, item in enumerate(items):
             # Inference mode
             if self.pairwise_infer:
                 clus_speaker_digits = sorted(list(set([x[2] for x in clus_label_dict[item['uniq_id']]])))
                 if item['rttm_file']:
                     base_scale_index = max(self.emb_dict.keys())
-                    _sess_spk_dict = self.emb_dict[base_scale_index][item['uniq_id']]['mapping']
+                    _sess_spk_dict = self.emb_dict[base_scale_index][item['uniq_id']].mapping
                     sess_spk_dict = {int(v.split('_')[-1]): k for k, v in _sess_spk_dict.items()}
                     rttm_speaker_digits = [int(v.split('_')[1]) for k, v in _sess_spk_dict.items()]
                     if self.seq_eval_mode:
@@ -1270,16 +1278,7 @@ class DiarizationSpeechLabel(DiarizationLabel):
 
             # Training mode
             else:
-                rttm_labels = []
-                with open(item['rttm_file'], 'r') as f:
-                    for line in f.readlines():
-                        start, end, speaker = self.split_rttm_line(line, decimals=3)
-                        rttm_labels.append('{} {} {}'.format(start, end, speaker))
-                speaker_set = set()
-                for rttm_line in rttm_labels:
-                    spk_str = rttm_line.split()[-1]
-                    speaker_set.add(spk_str)
-                speaker_list = sorted(list(speaker_set))
+                speaker_list = sorted(rttm_speaker_sets[item_index])
                 sess_spk_dict = {key: val for key, val in enumerate(speaker_list)}
                 target_spks = tuple(sess_spk_dict.keys())
                 clus_speaker_digits = target_spks
@@ -1346,6 +1345,24 @@ class DiarizationSpeechLabel(DiarizationLabel):
         speaker = rttm[7]
         return start, end, speaker
 
+    @staticmethod
+    def get_rttm_speaker_set(rttm_file: str) -> set:
+        """
+        Read the set of speaker labels in the given RTTM file. Only the speaker labels are needed, so the timestamps
+        of each RTTM line are not parsed.
+
+        Args:
+            rttm_file (str):
+                Path to the RTTM file.
+
+        Returns:
+            speaker_set (set):
+                Set of speaker label strings in the RTTM file.
+        """
+        with open(rttm_file, 'r') as f:
+            speaker_set = {line.split()[7] for line in f if line.strip()}
+        return speaker_set
+
     def __parse_item_rttm(self, line: str, manifest_file: str) -> Dict[str, Any]:
         """Parse each rttm file and save it to in Dict format"""
         item = json.loads(line)
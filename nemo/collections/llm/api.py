@@ -20,7 +20,6 @@ from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 import nemo_run as run
 import pytorch_lightning as pl
 import torch
-from rich.console import Console
 from typing_extensions import Annotated
 
 import nemo.lightning as nl
@@ -373,7 +372,6 @@ def deploy(
                     "nemo.deploy.service.rest_model_api:app",
                     host=rest_service_http_address,
                     port=rest_service_port,
-                    reload=True,
                 )
             except Exception as error:
                 logging.error("Error message has occurred during REST service start. Error message: " + str(error))
@@ -523,6 +521,8 @@ def import_ckpt(
         ValueError: If the model does not implement ConnectorMixin, indicating a lack of
             necessary importer functionality.
     """
+    from rich.console import Console
+
     output = io.import_ckpt(model=model, source=source, output_path=output_path, overwrite=overwrite)
 
     console = Console()
@@ -594,6 +594,8 @@ def export_ckpt(
         ValueError: If the model does not implement ConnectorMixin, indicating a lack of
             necessary exporter functionality.
     """
+    from rich.console import Console
+
     output = io.export_ckpt(path, target, output_path, overwrite, load_connector)
 
     console = Console()
@@ -608,7 +610,7 @@ def generate(
     prompts: list[str],
     trainer: nl.Trainer,
     encoder_prompts: Optional[list[str]] = None,
-    params_dtype: torch.dtype = torch.bfloat16,
+    params_dtype: Optional[torch.dtype] = None,
     add_BOS: bool = False,
     max_batch_size: int = 4,
     random_seed: Optional[int] = None,
@@ -668,7 +670,9 @@ def generate(
         prompts (list[str]): The list of prompts to generate text for.
         trainer (nl.Trainer): The trainer object.
         encoder_prompts (Optional[list[str]], optional): The list of encoder prompts. Defaults to None.
-        params_dtype (torch.dtype, optional): The data type of the model parameters. Defaults to torch.bfloat16.
+        params_dtype (Optional[torch.dtype], optional): The data type of the model parameters. Defaults to None,
+            which selects torch.bfloat16 on GPUs with native bf16 support (compute capability >= 8.0)
+            and torch.float16 otherwise.
         add_BOS (bool, optional): Whether to add the beginning of sequence token. Defaults to False.
         max_batch_size (int, optional): The maximum batch size. Defaults to 4.
         random_seed (Optional[int], optional): The random seed. Defaults to None.
@@ -684,6 +688,11 @@ def generate(
     """
     from nemo.collections.llm import inference
 
+    if params_dtype is None:
+        has_native_bf16 = torch.cuda.is_available() and torch.cuda.get_device_capability() >= (8, 0)
+        params_dtype = torch.bfloat16 if has_native_bf16 else torch.float16
+        logging.info(f"Using params_dtype={params_dtype} for generation")
+
     inference_wrapped_model, mcore_tokenizer = inference.setup_model_and_tokenizer(
         path=path,
         trainer=trainer,
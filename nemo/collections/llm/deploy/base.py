@@ -70,12 +70,6 @@ def get_trtllm_deployable(
     """
     from nemo.export.tensorrt_llm import TensorRTLLM
 
-    if triton_model_repository is None:
-        trt_llm_path = "/tmp/trt_llm_model_dir/"
-        Path(trt_llm_path).mkdir(parents=True, exist_ok=True)
-    else:
-        trt_llm_path = triton_model_repository
-
     if nemo_checkpoint is None and triton_model_repository is None:
         raise ValueError(
             "The provided model repository is not a valid TensorRT-LLM model "
@@ -91,6 +85,12 @@ def get_trtllm_deployable(
     if nemo_checkpoint is not None and model_type is None:
         raise ValueError("Model type is required to be defined if a nemo checkpoint is provided.")
 
+    if triton_model_repository is None:
+        trt_llm_path = "/tmp/trt_llm_model_dir/"
+        Path(trt_llm_path).mkdir(parents=True, exist_ok=True)
+    else:
+        trt_llm_path = triton_model_repository
+
     trt_llm_exporter = TensorRTLLM(
         model_dir=trt_llm_path,
         load_model=(nemo_checkpoint is None),
@@ -328,9 +328,12 @@ def create_data_iterator_getter(model, dataset, seq_len, batch_size, calibration
             batch = [ids + (seq_len - len(ids)) * [model.tokenizer.eos] for ids in batch]
             yield torch.tensor(batch, device=model.device)
 
+    batches = []
+
     def _iterator_getter():
-        dataloader = _iterator()
-        dataloader = [data for data in dataloader]
-        return iter(tqdm(dataloader))
+        # Tokenize once; calibration algorithms may run the forward loop several times
+        if not batches:
+            batches.extend(_iterator())
+        return iter(tqdm(batches))
 
     return _iterator_getter
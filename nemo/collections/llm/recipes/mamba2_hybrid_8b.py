@@ -75,7 +75,7 @@ def trainer(
     pipeline_parallelism_type: Optional[torch.dtype] = None,
     virtual_pipeline_parallelism: Optional[int] = None,
     context_parallelism: int = 1,
-    sequence_parallelism: bool = False,
+    sequence_parallelism: Optional[bool] = None,
     num_nodes: int = 1,
     num_gpus_per_node: int = 8,
     max_steps: int = 1168251,
@@ -92,7 +92,8 @@ def trainer(
         pipeline_parallelism_type (Optional[torch.dtype]): Data type for pipeline parallelism.
         virtual_pipeline_parallelism (Optional[int]): Size of virtual pipeline parallelism.
         context_parallelism (int): Degree of context parallelism.
-        sequence_parallelism (bool): Whether to use sequence parallelism.
+        sequence_parallelism (Optional[bool]): Whether to use sequence parallelism.
+            Defaults to enabling it when tensor_parallelism > 1.
         num_nodes (int): Number of compute nodes to use.
         num_gpus_per_node (int): Number of GPUs per node.
         max_steps (int): Maximum number of training steps.
@@ -113,6 +114,12 @@ def trainer(
         For more information on distributed training strategies, refer to the
         NeMo documentation on multi-GPU and multi-node training.
     """
+    if sequence_parallelism is None:
+        sequence_parallelism = tensor_parallelism > 1
+    assert (
+        not sequence_parallelism or tensor_parallelism > 1
+    ), "Sequence parallelism requires tensor_parallelism > 1"
+
     strategy = run.Config(
         nl.MegatronStrategy,
         tensor_model_parallel_size=tensor_parallelism,
@@ -122,7 +129,8 @@ def trainer(
         context_parallel_size=context_parallelism,
         sequence_parallel=sequence_parallelism,
         gradient_as_bucket_view=True,
-        ckpt_async_save=False,
+        ckpt_async_save=True,
+        ckpt_assume_constant_structure=True,
         ckpt_parallel_load=True,
         ddp=run.Config(
             DistributedDataParallelConfig,
@@ -191,9 +199,10 @@ def pretrain_recipe(
         For more details on pre-training LLMs with NeMo, see the pre-training
         guide in the `examples/llm/pretrain/` directory.
     """
+    model_config = model(tokenizer_model=tokenizer_model)
     return run.Partial(
         fn,
-        model=model(),
+        model=model_config,
         trainer=trainer(
             num_nodes=num_nodes,
             num_gpus_per_node=num_gpus_per_node,
@@ -204,7 +213,7 @@ def pretrain_recipe(
             seq_length=4096,
             global_batch_size=8,
             micro_batch_size=1,
-            tokenizer=tokenizer(tokenizer_model=tokenizer_model),
+            tokenizer=model_config.tokenizer,
         ),
         log=default_log(dir=dir, name=name, tensorboard_logger=tensorboard_logger(name=name)),
         optim=distributed_fused_adam_with_cosine_annealing(max_lr=3e-4),
@@ -273,7 +282,9 @@ def finetune_recipe(
         gradient_as_bucket_view=True,
         ckpt_load_optimizer=False,
         ckpt_save_optimizer=False,
-        ckpt_async_save=False,
+        ckpt_async_save=True,
+        ckpt_assume_constant_structure=True,
+        ckpt_parallel_load=True,
     )
     checkpoint_callback = run.Config(
         nl.ModelCheckpoint,
@@ -300,16 +311,17 @@ def finetune_recipe(
         use_distributed_sampler=False,
         val_check_interval=20,
     )
+    model_config = model(tokenizer_model=tokenizer_model)
     recipe = run.Partial(
         llm.finetune,
-        model=model(tokenizer_model=tokenizer_model),
+        model=model_config,
         trainer=trainer,
         data=run.Config(
             llm.SquadDataModule,
             seq_length=2048,
             global_batch_size=gbs,
             micro_batch_size=mbs,
-            tokenizer=tokenizer(tokenizer_model=tokenizer_model),
+            tokenizer=model_config.tokenizer,
         ),
         log=llm.default_log(dir=dir, name=name, tensorboard_logger=tensorboard_logger(name=name)),
         optim=distributed_fused_adam_with_cosine_annealing(max_lr=1e-4, min_lr=0, warmup_steps=50),
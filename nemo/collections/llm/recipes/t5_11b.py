@@ -111,6 +111,7 @@ def trainer(
         sequence_parallel=sequence_parallelism,
         gradient_as_bucket_view=True,
         ckpt_async_save=True,
+        ckpt_assume_constant_structure=True,
         ckpt_parallel_load=True,
         ddp=run.Config(
             DistributedDataParallelConfig,
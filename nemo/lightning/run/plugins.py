@@ -286,8 +286,13 @@ class PerfEnvPlugin(run.Plugin):
             # Force program order kernel launch for TP, CP overlap
             tp_size = task.trainer.strategy.tensor_model_parallel_size
             cp_size = task.trainer.strategy.context_parallel_size
-            if tp_size > 1 and cp_size > 1:
+            if tp_size > 1 or cp_size > 1:
                 executor.env_vars["CUDA_DEVICE_MAX_CONNECTIONS"] = "1"
+            elif executor.env_vars.get("CUDA_DEVICE_MAX_CONNECTIONS") == "1":
+                logging.warning(
+                    "CUDA_DEVICE_MAX_CONNECTIONS=1 serializes data-parallel grad reduce and param gather "
+                    "with compute. Unset it when tensor and context parallelism are both disabled."
+                )
 
             # Set LayerNorm SM margin to support the overlap with LayerNorm kernel
             if self.enable_layernorm_sm_margin:
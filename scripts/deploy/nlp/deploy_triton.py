@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import argparse
-import json
 import logging
 import os
 import sys
@@ -241,19 +240,15 @@ def get_args(argv):
     return args
 
 
-def store_args_to_json(args):
+def store_args_to_env(args):
     """
-    Stores user defined arg values relevant for REST API in config.json
+    Stores user defined arg values relevant for REST API in environment variables read by rest_model_api.py
     Gets called only when args.start_rest_service is True.
     """
-    args_dict = {
-        "triton_service_ip": args.triton_http_address,
-        "triton_service_port": args.triton_port,
-        "triton_request_timeout": args.triton_request_timeout,
-        "openai_format_response": args.openai_format_response,
-    }
-    with open("nemo/deploy/service/config.json", "w") as f:
-        json.dump(args_dict, f)
+    os.environ['TRITON_HTTP_ADDRESS'] = args.triton_http_address
+    os.environ['TRITON_PORT'] = str(args.triton_port)
+    os.environ['TRITON_REQUEST_TIMEOUT'] = str(args.triton_request_timeout)
+    os.environ['OPENAI_FORMAT_RESPONSE'] = str(args.openai_format_response)
 
 
 def get_trtllm_deployable(args):
@@ -391,8 +386,8 @@ def nemo_deploy(argv):
         if args.service_port == args.triton_port:
             logging.error("REST service port and Triton server port cannot use the same port.")
             return
-        # Store triton ip, port and other args relevant for REST API in config.json to be accessible by rest_model_api.py
-        store_args_to_json(args)
+        # Store triton ip, port and other args relevant for REST API as env vars to be accessible by rest_model_api.py
+        store_args_to_env(args)
 
     backend = args.backend.lower()
     if backend == 'tensorrt-llm':
@@ -433,7 +428,6 @@ def nemo_deploy(argv):
                     'nemo.deploy.service.rest_model_api:app',
                     host=args.service_http_address,
                     port=args.service_port,
-                    reload=True,
                 )
             except Exception as error:
                 logging.error("Error message has occurred during REST service start. Error message: " + str(error))
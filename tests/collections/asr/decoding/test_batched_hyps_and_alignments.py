@@ -173,6 +173,55 @@ class TestBatchedHyps:
         assert hyps.last_timestep.tolist() == [1, 2]
         assert hyps.last_timestep_lasts.tolist() == [2, 1]
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("device", DEVICES)
+    def test_add_results_masked_storage_increase(self, device: torch.device):
+        # storage is large enough for the first results, checks are done without synchronization
+        hyps = BatchedHyps(batch_size=2, init_length=3, device=device)
+        active_mask = torch.tensor([True, False], device=device)
+        labels = torch.tensor([5, 2], device=device)
+        scores = torch.tensor([0.5, 10.0], device=device)
+        with avoid_sync_operations(device=device):
+            for time_index in range(2):
+                time_indices = torch.tensor([time_index, 0], device=device)
+                hyps.add_results_masked_(
+                    active_mask=active_mask, labels=labels, time_indices=time_indices, scores=scores
+                )
+        # storage is increased when the results do not fit anymore
+        for time_index in range(2, 4):
+            time_indices = torch.tensor([time_index, 0], device=device)
+            hyps.add_results_masked_(active_mask=active_mask, labels=labels, time_indices=time_indices, scores=scores)
+        assert hyps.current_lengths.tolist() == [4, 0]
+        assert hyps.transcript.tolist()[0][:4] == [5, 5, 5, 5]
+        assert hyps.timesteps.tolist()[0][:4] == [0, 1, 2, 3]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("device", DEVICES)
+    def test_clear_and_reuse(self, device: torch.device):
+        # after clearing, the storage is reused and previous results are not visible
+        hyps = BatchedHyps(batch_size=2, init_length=2, device=device)
+        hyps.add_results_masked_no_checks_(
+            active_mask=torch.tensor([True, True], device=device),
+            labels=torch.tensor([5, 2], device=device),
+            time_indices=torch.tensor([1, 1], device=device),
+            scores=torch.tensor([0.5, 1.0], device=device),
+        )
+        hyps.clear_()
+        hyps.add_results_masked_no_checks_(
+            active_mask=torch.tensor([False, True], device=device),
+            labels=torch.tensor([3, 4], device=device),
+            time_indices=torch.tensor([0, 0], device=device),
+            scores=torch.tensor([2.0, 1.5], device=device),
+        )
+        assert hyps.current_lengths.tolist() == [0, 1]
+        assert hyps.transcript.tolist()[1][:1] == [4]
+        assert hyps.scores.tolist() == pytest.approx([0.0, 1.5])
+        assert hyps.last_timestep.tolist() == [-1, 0]
+        assert hyps.last_timestep_lasts.tolist() == [0, 1]
+        hypotheses = batched_hyps_to_hypotheses(hyps)
+        assert hypotheses[0].y_sequence.tolist() == []
+        assert hypotheses[1].y_sequence.tolist() == [4]
+
     @pytest.mark.unit
     @pytest.mark.parametrize("device", DEVICES)
     def test_torch_jit_compatibility_add_results(self, device: torch.device):
@@ -524,3 +524,44 @@ class TestRNNTDecoding:
         )
         beam_config["ngram_lm_model"] = kenlm_model_path
         check_beam_decoding(test_data_dir, beam_config)
+
+    @pytest.mark.unit
+    def test_tdt_prefix_search(self):
+        token_list = [" ", "a", "b", "c"]
+        vocab_size = len(token_list)
+        durations = [0, 1, 2]
+
+        prednet_cfg = {'pred_hidden': 4, 'pred_rnn_layers': 1}
+        jointnet_cfg = {'encoder_hidden': 4, 'pred_hidden': 4, 'joint_hidden': 4, 'activation': 'relu'}
+
+        decoder = RNNTDecoder(prednet_cfg, vocab_size)
+        joint_net = RNNTJoint(jointnet_cfg, vocab_size, num_extra_outputs=len(durations), vocabulary=token_list)
+
+        beam = tdt_beam_decoding.BeamTDTInfer(
+            decoder, joint_net, durations=durations, beam_size=2, search_type="maes", maes_expansion_beta=1
+        )
+        # stub ngram LM with zero scores to cover the LM state handling
+        beam.ngram_lm = True
+        beam.ngram_lm_alpha = 0.3
+        beam.compute_ngram_score = lambda state, label: (0.0, state)
+
+        blank = decoder.blank_idx
+        dec_outs = [torch.randn(1, 4) for _ in range(3)]
+        hyp_prefix = rnnt_utils.Hypothesis(y_sequence=[blank], score=-1.0, dec_out=dec_outs[:1], ngram_lm_state=None)
+        hyp = rnnt_utils.Hypothesis(y_sequence=[blank, 1, 2], score=-3.0, dec_out=dec_outs, ngram_lm_state=None)
+        enc_out = torch.randn(1, 1, 4)
+
+        with torch.no_grad():
+            # reference: one joint call per token
+            expected_score = hyp_prefix.score
+            for token, dec_out in zip([1, 2], dec_outs[:2]):
+                logits = joint_net.joint(enc_out, dec_out.unsqueeze(0))[0, 0, 0]
+                logp = torch.log_softmax(logits[: -len(durations)], dim=-1)
+                duration_logp = torch.log_softmax(logits[-len(durations) :], dim=-1)
+                expected_score += float(logp[token] + duration_logp[beam.zero_duration_idx])
+            expected_score = torch.logaddexp(torch.tensor(hyp.score), torch.tensor(expected_score)).item()
+
+            beam.prefix_search([hyp, hyp_prefix], enc_out, prefix_alpha=2)
+
+        assert hyp.score == pytest.approx(expected_score, abs=1e-5)
+        assert hyp_prefix.score == -1.0
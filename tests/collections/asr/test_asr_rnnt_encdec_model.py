@@ -1161,6 +1161,54 @@ class TestEncDecRNNTModel:
                         assert torch.is_tensor(logp)
                         assert torch.is_tensor(label)
 
+    @pytest.mark.unit
+    def test_prefix_search_hat_subtract_ilm(self):
+        token_list = [" ", "a", "b", "c"]
+        vocab_size = len(token_list)
+
+        encoder_output_size = 4
+        decoder_output_size = 4
+        joint_output_shape = 4
+
+        prednet_cfg = {'pred_hidden': decoder_output_size, 'pred_rnn_layers': 1}
+        jointnet_cfg = {
+            'encoder_hidden': encoder_output_size,
+            'pred_hidden': decoder_output_size,
+            'joint_hidden': joint_output_shape,
+            'activation': 'relu',
+        }
+
+        decoder = RNNTDecoder(prednet_cfg, vocab_size)
+        joint_net = HATJoint(jointnet_cfg, vocab_size, vocabulary=token_list)
+        joint_net.return_hat_ilm = True
+
+        beam = beam_decode.BeamRNNTInfer(
+            decoder, joint_net, beam_size=2, search_type="maes", hat_subtract_ilm=True, hat_ilm_weight=0.5
+        )
+        # stub ngram LM with zero scores, only the ILM term contributes
+        beam.ngram_lm = True
+        beam.ngram_lm_alpha = 0.3
+        beam.compute_ngram_score = lambda state, label: (0.0, state)
+
+        blank = decoder.blank_idx
+        dec_outs = [torch.randn(1, decoder_output_size) for _ in range(3)]
+        hyp_prefix = rnnt_utils.Hypothesis(y_sequence=[blank], score=-1.0, dec_out=dec_outs[:1], ngram_lm_state=None)
+        hyp = rnnt_utils.Hypothesis(y_sequence=[blank, 1, 2], score=-3.0, dec_out=dec_outs, ngram_lm_state=None)
+        enc_out = torch.randn(1, 1, encoder_output_size)
+
+        with torch.no_grad():
+            expected_score = hyp_prefix.score
+            for token, dec_out in zip([1, 2], dec_outs[:2]):
+                joint_output = joint_net.joint(enc_out, dec_out.unsqueeze(0))
+                expected_score += float(joint_output.hat_logprobs[0, 0, 0, token])
+                expected_score -= beam.hat_ilm_weight * float(joint_output.ilm_logprobs[0, 0, 0, token])
+            expected_score = torch.logaddexp(torch.tensor(hyp.score), torch.tensor(expected_score)).item()
+
+            beam.prefix_search([hyp, hyp_prefix], enc_out, prefix_alpha=2)
+
+        assert hyp.score == pytest.approx(expected_score, abs=1e-5)
+        assert hyp_prefix.score == -1.0
+
     @pytest.mark.skipif(
         not NUMBA_RNNT_LOSS_AVAILABLE,
         reason='RNNTLoss has not been compiled with appropriate numba version.',
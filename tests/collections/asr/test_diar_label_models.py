@@ -16,6 +16,7 @@ import pytest
 import torch
 from omegaconf import DictConfig
 
+from nemo.collections.asr.losses.bce_loss import BCELoss
 from nemo.collections.asr.models import EncDecDiarLabelModel
 
 
@@ -165,3 +166,15 @@ class TestEncDecDiarLabelModel:
         assert diff <= 1e-6
         diff = torch.max(torch.abs(scale_weights_instance - scale_weights_batch))
         assert diff <= 1e-6
+
+    @pytest.mark.unit
+    def test_bce_loss_from_logits(self):
+        logits = torch.randn(size=(4, 25, 2))
+        labels = torch.randint(2, size=(4, 25, 2)).float()
+        signal_lengths = torch.tensor([25, 20, 15, 10])
+
+        loss_probs = BCELoss(weight=None)(probs=torch.sigmoid(logits), labels=labels, signal_lengths=signal_lengths)
+        loss_logits = BCELoss(weight=None, from_logits=True)(
+            logits=logits, labels=labels, signal_lengths=signal_lengths
+        )
+        assert torch.allclose(loss_probs, loss_logits, atol=1e-4)
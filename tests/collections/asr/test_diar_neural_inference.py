@@ -13,11 +13,13 @@
 # limitations under the License.
 
 import os
+from types import SimpleNamespace
 
+import numpy as np
 import pytest
 import torch
 
-from nemo.collections.asr.models.msdd_models import NeuralDiarizer
+from nemo.collections.asr.models.msdd_models import ClusterEmbedding, NeuralDiarizer
 
 
 class TestNeuralDiarizerInference:
@@ -69,3 +71,24 @@ class TestNeuralDiarizerInference:
             # assert only 1 speaker & segment
             assert len(annotation.labels()) == 1
             assert len(list(annotation.itersegments())) == 1
+
+
+class TestClusterEmbedding:
+    @pytest.mark.unit
+    def test_assign_labels_to_longer_segs_tie(self):
+        """
+        Tied votes go to the label that appears first among the mapped base-scale segments.
+        """
+        clus_embedding = SimpleNamespace(scale_n=2, base_scale_index=1)
+        base_clus_label_dict = {
+            'sess': [[0.0, 0.5, 1], [0.25, 0.75, 0], [0.5, 1.0, 2], [0.75, 1.25, 2], [1.0, 1.5, 0]],
+        }
+        # Segment 0 holds labels [1, 0] (tie), segment 1 holds [2, 2], segment 2 is empty, segment 3 holds [0].
+        session_scale_mapping_dict = {'sess': np.array([[0, 0, 1, 1, 3], [0, 1, 2, 3, 4]])}
+
+        all_scale_clus_label_dict = ClusterEmbedding.assign_labels_to_longer_segs(
+            clus_embedding, base_clus_label_dict, session_scale_mapping_dict
+        )
+
+        assert all_scale_clus_label_dict[1]['sess'].tolist() == [1, 0, 2, 2, 0]
+        assert all_scale_clus_label_dict[0]['sess'].tolist() == [1, 2, 2, 0]
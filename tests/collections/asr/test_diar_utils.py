@@ -19,13 +19,17 @@ import pytest
 import torch
 from scipy.optimize import linear_sum_assignment as scipy_linear_sum_assignment
 
+from nemo.collections.asr.data.audio_to_diar_label import _AudioMSDDTrainDataset
 from nemo.collections.asr.data.audio_to_label import repeat_signal
 from nemo.collections.asr.parts.utils.longform_clustering import LongFormSpeakerClustering
 from nemo.collections.asr.parts.utils.offline_clustering import (
     SpeakerClustering,
+    get_argmin_mat,
     get_scale_interpolated_embs,
     getCosAffinityMatrix,
     getKneighborsConnections,
+    getMultiScaleCosAffinityMatrix,
+    getRepeatedList,
     split_input_data,
 )
 from nemo.collections.asr.parts.utils.online_clustering import (
@@ -43,6 +47,8 @@ from nemo.collections.asr.parts.utils.speaker_utils import (
     OnlineSegmentor,
     check_ranges,
     fl2int,
+    get_existing_filepaths,
+    get_majority_mapped_labels,
     get_new_cursor_for_update,
     get_online_segments_from_slices,
     get_online_subsegments_from_buffer,
@@ -52,8 +58,10 @@ from nemo.collections.asr.parts.utils.speaker_utils import (
     get_target_sig,
     int2fl,
     is_overlap,
+    load_pickle_with_buffers,
     merge_float_intervals,
     merge_int_intervals,
+    save_pickle_with_buffers,
     tensor_to_list,
 )
 
@@ -270,6 +278,23 @@ class TestDiarizationSequneceUtilFunctions:
         # affinity_mat should not contain any nan element
         assert torch.any(torch.isnan(affinity_mat)) == False
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n_spks", [2, 4])
+    @pytest.mark.parametrize("block_size", [1, 7, 4096])
+    def test_multiscale_cosine_affinity_blockwise(self, n_spks, block_size):
+        em, ts, mc, mw, spk_ts, gt = generate_toy_data(n_spks=n_spks, spk_dur=5)
+        em_s, ts_s = split_input_data(em, ts, mc)
+        fused_mat = getMultiScaleCosAffinityMatrix(mw, em_s, ts_s, block_size=block_size)
+        # Reference: repeat the rows and columns of each scale's affinity matrix by the mapped segment counts
+        target_mat = torch.zeros_like(fused_mat)
+        for scale_idx, mapping_argmat in enumerate(get_argmin_mat(ts_s)):
+            score_mat = getCosAffinityMatrix(em_s[scale_idx].half())
+            repeat_list = getRepeatedList(mapping_argmat, torch.tensor(score_mat.shape[0]))
+            repeated_mat = torch.repeat_interleave(score_mat, repeats=repeat_list, dim=0)
+            repeated_mat = torch.repeat_interleave(repeated_mat, repeats=repeat_list, dim=1)
+            target_mat += mw.squeeze(0)[scale_idx] * repeated_mat
+        assert torch.allclose(fused_mat, target_mat)
+
     @pytest.mark.unit
     @pytest.mark.parametrize("n_spks", [4, 5, 6])
     @pytest.mark.parametrize("target_speaker_index", [0, 1, 2])
@@ -422,6 +447,39 @@ class TestDiarizationSegmentationUtils:
     def test_int2fl(self, x, decimals):
         assert abs(int2fl(x, decimals) - round(x / (10 ** decimals), decimals)) < (10 ** -(decimals + 1))
 
+    @pytest.mark.unit
+    def test_pickle_with_buffers_save_load(self, tmp_path):
+        obj = (
+            {0: {'sess_a': torch.randn(3, 8), 'sess_b': torch.randn(5, 8)}},
+            {'sess_a': [[0.0, 1.5, 0], [1.5, 3.0, 1]]},
+            np.arange(6, dtype=np.int64).reshape(2, 3),
+            None,
+        )
+        filepath = str(tmp_path / 'clustering_outputs.pkl')
+        save_pickle_with_buffers(obj, filepath)
+        loaded_obj = load_pickle_with_buffers(filepath)
+        for uniq_id, emb in obj[0][0].items():
+            assert torch.equal(loaded_obj[0][0][uniq_id], emb)
+        assert loaded_obj[1] == obj[1]
+        assert np.array_equal(loaded_obj[2], obj[2])
+        assert loaded_obj[3] is None
+        # Out-of-band buffers start at aligned offsets of the mapping, whatever the size of the preceding data.
+        assert all(emb.data_ptr() % 64 == 0 for emb in loaded_obj[0][0].values())
+        assert loaded_obj[2].ctypes.data % 64 == 0
+        # Restored data is backed by a private mapping, so writing to it must not change the saved file.
+        loaded_obj[0][0]['sess_a'].zero_()
+        reloaded_obj = load_pickle_with_buffers(filepath)
+        assert torch.equal(reloaded_obj[0][0]['sess_a'], obj[0][0]['sess_a'])
+
+    @pytest.mark.unit
+    def test_get_existing_filepaths(self, tmp_path):
+        (tmp_path / 'rttm').mkdir()
+        existing = [str(tmp_path / 'rttm' / 'sess_a.rttm'), str(tmp_path / 'sess_b.rttm')]
+        for filepath in existing:
+            open(filepath, 'w').close()
+        missing = [str(tmp_path / 'rttm' / 'sess_c.rttm'), str(tmp_path / 'no_dir' / 'sess_d.rttm')]
+        assert get_existing_filepaths(existing + missing) == set(existing)
+
     @pytest.mark.unit
     def test_merge_float_intervals_edge_margin_test(self):
         intervals = [[0.0, 1.0], [1.0, 2.0]]
@@ -546,6 +604,39 @@ class TestDiarizationSegmentationUtils:
         assert len(sig_rangel_list) == 2
         assert len(sig_indexes) == 2
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "scale_mapping, labels, num_segs, expected",
+        [
+            ([0, 0, 1, 1, 1], [2, 2, 0, 1, 1], 2, [2, 1]),  # majority vote
+            ([0, 0, 1, 1], [1, 0, 2, 0], 2, [1, 2]),  # ties go to the first label in the segment
+            ([0, 0, 1, 1], [-1, 0, 0, -1], 2, [-1, 0]),  # negative labels
+            ([1, 1, 3], [1, 1, 0], 5, [0, 1, 1, 0, 0]),  # empty segments inherit the preceding label
+            ([], [], 3, [0, 0, 0]),  # no base-scale segments
+        ],
+    )
+    def test_get_majority_mapped_labels(self, scale_mapping, labels, num_segs, expected):
+        new_labels = get_majority_mapped_labels(np.array(scale_mapping), np.array(labels), num_segs)
+        assert new_labels.tolist() == expected
+
+    @pytest.mark.unit
+    def test_msdd_train_dataset_assign_labels_to_longer_segs(self):
+        uniq_id = 'sess'
+        dataset = _AudioMSDDTrainDataset.__new__(_AudioMSDDTrainDataset)
+        dataset.multiscale_timestamp_dict = {
+            uniq_id: {
+                'scale_dict': {
+                    0: {'time_stamps': [[0.0, 1.0], [1.0, 2.0]]},
+                    1: {'time_stamps': [[0.0, 0.5], [0.5, 1.0], [1.0, 1.5], [1.5, 2.0]]},
+                }
+            }
+        }
+        # Both longer-scale segments hold a tie, which goes to the label that appears first.
+        base_scale_clus_label = torch.tensor([1, 0, -1, 2])
+        per_scale_clus_label, scale_mapping = dataset.assign_labels_to_longer_segs(uniq_id, base_scale_clus_label)
+        assert scale_mapping.tolist() == [[0, 0, 1, 1], [0, 1, 2, 3]]
+        assert per_scale_clus_label.tolist() == [1, -1, 1, 0, -1, 2]
+
 
 class TestClusteringUtilFunctions:
     @pytest.mark.parametrize("p_value", [1, 5, 9])
@@ -56,6 +56,7 @@ class TestT5_11B:
         assert trainer_config.strategy.sequence_parallel is False
         assert trainer_config.strategy.gradient_as_bucket_view is True
         assert trainer_config.strategy.ckpt_async_save is True
+        assert trainer_config.strategy.ckpt_assume_constant_structure is True
         assert trainer_config.strategy.ckpt_parallel_load is True
 
         # Check other trainer configurations